@@ -1,29 +1,45 @@
 # -*- coding: utf-8 -*-
 import builtins
-from itertools import zip_longest
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+import gzip
+import hashlib
+from io import BytesIO
+from itertools import chain, zip_longest
+import json
 import keyword
+from operator import attrgetter
+import os
 from pathlib import Path
 import re
-from typing import Dict, Generator, Iterable, List, Optional, Tuple, Union
-from urllib.request import urlopen
+import sys
+from types import MappingProxyType
+from typing import Deque, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
 
+from lxml.etree import XPath, iterparse, iterwalk, tostring
 from lxml.html import HtmlElement, fromstring
 
+reference_url = 'https://dev.twitch.tv/docs/api/reference'
 nbsp = re.compile(r' *\xa0 *')
-has_possible_multi_param = re.compile(r'\b(?:Maximum|Limit): (\d+)(?! characters)(?=\D|$)')
+has_possible_multi_param = re.compile(r'\b(?:Maximum|Limit): (\d+)(?! characters)(?=\D|$)', re.ASCII)
 url_extractor = re.compile(r'^`(?P<url_method>[A-Z]+ )?(?:https://api\.twitch\.tv/)?helix/(?P<url_path>[^?`]+)[^`]*`$')
-illegal_endpoint_field_variables = set(dir(builtins)) | set(keyword.kwlist) | {'params', 'data'}
-sections_xpath = '//section[@class = "left-docs"]/h2[position() = 1]/..'
-section_child_xpath = '*[not(name() = "a" and @class = "editor-link") and not(position() = 1)]'
-url_triggers = ['URL', 'URLs']
-parameter_triggers = [
+illegal_endpoint_field_variables = frozenset(dir(builtins)) | frozenset(keyword.kwlist) | {'params', 'data'}
+section_child_xpath = XPath('*[not(name() = "a" and @class = "editor-link") and not(position() = 1)]')
+section_id_xpath = XPath('h2[1]/@id')
+section_title_xpath = XPath('h2[1]/text()')
+table_rows_xpath = XPath('*/tr')
+url_triggers = frozenset({'URL', 'URLs'})
+parameter_triggers = (
     'Body Parameter',
     'Query Parameter',
     'Query Paramater',
     'Body Value',
     'Request Body',
-]
-table_header_parameter_columns = ['Field', 'Fields', 'Name', 'Paramater', 'Parameter']
+)
+parameter_trigger = re.compile('|'.join(map(re.escape, parameter_triggers)))
+table_header_parameter_columns = frozenset({'Field', 'Fields', 'Name', 'Paramater', 'Parameter'})
 type_value_lookup: Dict[str, Union[str, Dict[str, str]]] = {
     'array': {
         'update_drops_entitlements.entitlement_ids': 'List[str]',
@@ -38,22 +54,29 @@ type_value_lookup: Dict[str, Union[str, Dict[str, str]]] = {
     'string array': 'List[str]',
     'transport': 'Dict[str, Any]',  # https://dev.twitch.tv/docs/eventsub/eventsub-reference#transport
 }
-object_types = ['object', 'object[]']
+object_types = ('object', 'object[]')
 url_method_fallbacks = {
     'get_stream_key': 'GET',
 }
-spelling_fixes = {
-    'doesn’t': "doesn't",
-    'requestion': 'request',
-    'invalide': 'invalid',
-    'Invalide': 'Invalid',
-    'Minumum': 'Minimum',
-    'undertermined': 'undetermined',
-    'uesrs': 'users',
-    'Paramater': 'Parameter',
-    'currenty': 'currently',
-    'coutry': 'country',
-}
+spelling_fixes = MappingProxyType(
+    {
+        'doesn’t': "doesn't",
+        'requestion': 'request',
+        'invalide': 'invalid',
+        'Invalide': 'Invalid',
+        'Minumum': 'Minimum',
+        'undertermined': 'undetermined',
+        'uesrs': 'users',
+        'Paramater': 'Parameter',
+        'currenty': 'currently',
+        'coutry': 'country',
+    }
+)
+misspelling = re.compile('|'.join(map(re.escape, sorted(spelling_fixes, key=len, reverse=True))))
+
+
+def fix_spelling(text: str) -> str:
+    return misspelling.sub(lambda match: spelling_fixes[match.group()], text)
 
 
 def clean_reserved(s: str) -> str:
@@ -65,50 +88,80 @@ def indent(lines: Iterable[str]) -> List[str]:
 
 
 def split_table_row_lines(row: List[str]) -> List[Tuple[str, ...]]:
+    if not any('\n' in cell for cell in row):
+        return [tuple(cell.strip() for cell in row)]
     return list(zip_longest(*[map(str.strip, cell.split('\n')) for cell in row], fillvalue=''))
 
 
-def format_table(table_rows: List[List[str]]) -> List[str]:
+def format_table(table_rows: List[List[str]], formatted: List[str]) -> None:
     expanded_rows = [split_table_row_lines(row) for row in table_rows]
 
-    max_lengths = [
-        max(len(inner_row[i]) for row in expanded_rows for inner_row in row) for i in range(len(expanded_rows[0][0]))
-    ]
+    max_lengths = [0] * len(expanded_rows[0][0])
+    for row in expanded_rows:
+        for inner_row in row:
+            for i, length in enumerate(map(len, inner_row)):
+                if length > max_lengths[i]:
+                    max_lengths[i] = length
     middle = '-+-'.join('-' * length for length in max_lengths)
     horizontal = f'+-{middle}-+'
 
-    formatted = [horizontal]
+    formatted.append(horizontal)
     for row in expanded_rows:
-        for inner_row in row:
-            middle = ' | '.join(cell.ljust(length, ' ') for cell, length in zip(inner_row, max_lengths))
-            formatted_row = f'| {middle} |'
-            formatted.append(formatted_row)
+        formatted.extend(
+            f'| {" | ".join(cell.ljust(length) for cell, length in zip(inner_row, max_lengths))} |' for inner_row in row
+        )
         formatted.append(horizontal)
-    return formatted
-
-
-def node_text_iter(node: HtmlElement) -> Generator[str, None, None]:
-    if node.tag == 'code':
-        yield f'`{node.text}`'
-    elif node.tag == 'li':
-        yield f'\n- {node.text}'
-    else:
-        yield node.text
-
-    for child in node:
-        if child.tag == 'br':
-            yield '\n'
-        else:
-            yield from node_text_iter(child)
-        yield child.tail
 
 
 def node_text(node: HtmlElement, do_strip=True) -> str:
-    text = nbsp.sub(' ', ''.join(text or '' for text in node_text_iter(node)))
+    if next(node.iter('code', 'br', 'li'), None) is None:
+        # Nothing needs special formatting, lxml can collect the text on its own
+        text = nbsp.sub(' ', ''.join(node.itertext()))
+        return text.strip() if do_strip else text
+
+    parts: List[str] = []
+    append = parts.append
+    walker = iterwalk(node, events=('start', 'end'))
+    for event, element in walker:
+        if event == 'end':
+            if element.tail and element is not node:
+                append(element.tail)
+        elif element.tag == 'br' and element is not node:
+            append('\n')
+            walker.skip_subtree()
+        elif element.tag == 'code':
+            append(f'`{element.text}`')
+        elif element.tag == 'li':
+            append(f'\n- {element.text}')
+        elif element.text:
+            append(element.text)
+
+    text = nbsp.sub(' ', ''.join(parts))
     return text.strip() if do_strip else text
 
 
+by_local_variable = attrgetter('local_variable')
+
+
 class EndpointField:
+    __slots__ = (
+        '_field_name',
+        '_required_value',
+        '_field_type',
+        '_description',
+        '_is_required',
+        '_documentation_line',
+        'field_name',
+        'local_variable',
+        'is_inner_field',
+        '_field_type_lower',
+        'parent_field',
+        'is_object_list',
+        'inner_fields',
+        '_inner_field_variables',
+        '_annotations',
+    )
+
     FIELD_NAME_ATTR = '_field_name'
     REQUIRED_VALUE_ATTR = '_required_value'
     FIELD_TYPE_ATTR = '_field_type'
@@ -127,35 +180,47 @@ class EndpointField:
         self._required_value = required_value
         self._field_type = field_type
         self._description = description
-        self._ordering = ordering
         self._is_required = is_required
+        self._documentation_line = [getattr(self, attr) for attr in ordering]
+
+        bare_name = field_name.replace('`', '')
+        self.field_name = bare_name.split('.')[-1].strip()
+        self.local_variable = clean_reserved(bare_name.replace('.', '_').strip())
+        # Inner fields are either dotted or indented under their parent
+        self.is_inner_field = '.' in bare_name or bare_name.startswith(' ')
+        self._field_type_lower = field_type.lower()
 
         self.parent_field: Optional['EndpointField'] = None
-        self.is_object_list = self._field_type.lower() == 'object[]'
+        self.is_object_list = self._field_type_lower == 'object[]'
         self.inner_fields: List['EndpointField'] = []
+        self._inner_field_variables: Set[str] = set()
+
+        self._annotations: Dict[str, str] = {}
 
     @property
     def documentation(self) -> List[List[str]]:
-        self_line = [getattr(self, attr) for attr in self._ordering]
-        documentation = [self_line]
+        documentation = [self._documentation_line]
         for field in self.inner_fields:
             documentation.extend(field.documentation)
         return documentation
 
-    @property
-    def field_name(self) -> str:
-        return self._field_name.replace('`', '').split('.')[-1].strip()
-
-    @property
-    def local_variable(self):
-        return clean_reserved(self._field_name.replace('`', '').replace('.', '_').strip())
-
     @property
     def local_variable_with_part(self):
         return f'_{self.field_name}_part'
 
-    def annotation(self, function_name: str):
-        type_value = type_value_lookup[self._field_type.lower()]
+    def add_inner_field(self, field: 'EndpointField'):
+        field.parent_field = self
+        if field.local_variable not in self._inner_field_variables:
+            self._inner_field_variables.add(field.local_variable)
+            self.inner_fields.append(field)
+
+    def annotation(self, function_name: str) -> str:
+        if function_name not in self._annotations:
+            self._annotations[function_name] = self._build_annotation(function_name)
+        return self._annotations[function_name]
+
+    def _build_annotation(self, function_name: str) -> str:
+        type_value = type_value_lookup[self._field_type_lower]
         if isinstance(type_value, dict):
             annotation = type_value[f'{function_name}.{self.field_name}']
         else:
@@ -163,10 +228,7 @@ class EndpointField:
 
         param_multi_limit = has_possible_multi_param.search(self._description)
         if param_multi_limit and param_multi_limit.group(1) != '1':
-            is_type_naturally_counted = (
-                any(annotation.lower().startswith(predicate) for predicate in ('int', 'list'))
-                or self.field_name == 'first'
-            )
+            is_type_naturally_counted = annotation.lower().startswith(('int', 'list')) or self.field_name == 'first'
             if not is_type_naturally_counted:
                 annotation = f'Union[{annotation}, List[{annotation}]]'
 
@@ -185,7 +247,7 @@ class EndpointField:
         code lines that should run first, can be empty
         """
         additional_code: List[str] = []
-        inner_fields = sorted(self.inner_fields, key=lambda f: f.local_variable)
+        inner_fields = sorted(self.inner_fields, key=by_local_variable)
 
         if inner_fields:
             lv = f'_{self.local_variable}'
@@ -219,19 +281,18 @@ class EndpointField:
 
 
 class EndpointFieldTable:
-    def __init__(self, node: HtmlElement, is_parameter_required_by_header: bool):
-        self._node = node
+    __slots__ = ('_fields', '_field_variables', '_header_row')
 
+    def __init__(self, table_trs: List[HtmlElement], header_row: List[str], is_parameter_required_by_header: bool):
         self._fields: List[EndpointField] = []
-        self._header_row: List[str] = []
+        self._field_variables: Set[str] = set()
+        self._header_row = header_row
 
-        self._parse_node(is_parameter_required_by_header)
+        self._parse_rows(table_trs, is_parameter_required_by_header)
 
-    def _parse_node(self, is_parameter_required_by_header: bool):
+    def _parse_rows(self, table_trs: List[HtmlElement], is_parameter_required_by_header: bool):
         is_parameter_requirement_in_table = False
-        table_trs = self._node.xpath('*/tr')
 
-        self._header_row = [node_text(th) for th in table_trs[0]]
         type_column_index = self._header_row.index('Type')
         if self._header_row[1] == 'Required':
             ordering = [
@@ -246,40 +307,28 @@ class EndpointFieldTable:
 
         for body_row in table_trs[1:]:
             row_text = [node_text(td, do_strip=False) for td in body_row]
-            field_name = row_text[0]
             required_value = row_text[1] if is_parameter_requirement_in_table else ''
-            field_type = row_text[type_column_index]
-            description = row_text[-1]
-            is_required = is_parameter_required_by_header or (
-                is_parameter_requirement_in_table and row_text[1].lower() == 'yes'
+            is_required = is_parameter_required_by_header or required_value.lower() == 'yes'
+            field = EndpointField(
+                row_text[0], required_value, row_text[type_column_index], row_text[-1], ordering, is_required
             )
-            field = EndpointField(field_name, required_value, field_type, description, ordering, is_required)
-            if '.' in field_name or field_name.replace('`', '').startswith(' '):
-                field.parent_field = self._fields[-1]
-                if all(field.local_variable != f.local_variable for f in self._fields[-1].inner_fields):
-                    self._fields[-1].inner_fields.append(field)
-            else:
-                if all(field.local_variable != f.local_variable for f in self._fields):
-                    self._fields.append(field)
+            if field.is_inner_field:
+                self._fields[-1].add_inner_field(field)
+            elif field.local_variable not in self._field_variables:
+                self._field_variables.add(field.local_variable)
+                self._fields.append(field)
 
     @property
-    def documentation(self) -> List[str]:
+    def documentation(self) -> List[List[str]]:
         lines = [self._header_row]
         for field in self._fields:
             lines.extend(field.documentation)
-        return format_table(lines)
-
-    def function_parameters(self, function_name: str) -> List[str]:
-        parameters = []
+        return lines
 
+    def function_parameters(self, function_name: str) -> Iterator[str]:
         for field in self._fields:
-            if field.inner_fields:
-                for inner_field in field.inner_fields:
-                    parameters.append(inner_field.function_parameter(function_name))
-            else:
-                parameters.append(field.function_parameter(function_name))
-
-        return parameters
+            for parameter_field in field.inner_fields or [field]:
+                yield parameter_field.function_parameter(function_name)
 
     @property
     def code_lines(self) -> Tuple[List[str], List[str]]:
@@ -292,7 +341,7 @@ class EndpointFieldTable:
         if not self._fields:
             return [], []
 
-        kwargs_and_code = [field.as_kwarg() for field in sorted(self._fields, key=lambda f: f.local_variable)]
+        kwargs_and_code = [field.as_kwarg() for field in sorted(self._fields, key=by_local_variable)]
         code = []
         for _, additional_code in kwargs_and_code:
             code.extend(additional_code)
@@ -300,8 +349,23 @@ class EndpointFieldTable:
 
 
 class EndpointFunction:
+    __slots__ = (
+        '_node',
+        'function_name',
+        '_url_params_tables',
+        '_request_body_tables',
+        '_documentation_lines',
+        '_url_method',
+        '_url_path',
+        '_is_under_url_header',
+        '_is_parameter_for_body',
+        '_is_under_parameter_header',
+        '_is_parameter_required_by_header',
+    )
+
     def __init__(self, node: HtmlElement):
         self._node = node
+        self.function_name: str = section_id_xpath(node)[0].replace('-', '_')
 
         self._url_params_tables: List[EndpointFieldTable] = []
         self._request_body_tables: List[EndpointFieldTable] = []
@@ -319,22 +383,21 @@ class EndpointFunction:
         self._parse_node()
 
     def _parse_div(self, node: HtmlElement):
-        div_content = node_text(node).split('\n')
-        self._documentation_lines.extend(indent(line for line in map(str.strip, div_content) if line))
+        lines = (line.strip() for line in node_text(node).split('\n'))
+        self._documentation_lines.extend(f'    {line}' for line in lines if line)
         self._documentation_lines.append('')
 
     def _parse_header(self, node: HtmlElement):
         header_text = node_text(node)
         self._is_under_url_header = header_text in url_triggers
-        self._is_under_parameter_header = any(p in header_text for p in parameter_triggers)
+        self._is_under_parameter_header = parameter_trigger.search(header_text) is not None
         self._is_parameter_for_body = self._is_under_parameter_header and 'Body' in header_text
         self._is_parameter_required_by_header = header_text.startswith('Required')
         self._documentation_lines.append(f'# {header_text}:')
 
     def _parse_paragraph(self, node: HtmlElement):
         text_lines = node_text(node).split('\n')
-        is_empty = len(text_lines) == 0 or (len(text_lines) == 1 and not len(text_lines[0]))
-        if not is_empty:
+        if text_lines:
             if self._is_under_url_header:
                 match_result = url_extractor.match(text_lines[0])
                 if match_result:
@@ -348,23 +411,22 @@ class EndpointFunction:
         self._is_under_url_header = False
 
     def _parse_table(self, node: HtmlElement):
-        table_trs = node.xpath('*/tr')
+        table_trs = table_rows_xpath(node)
         header_row = table_trs[0]
         header_text = [node_text(th) for th in header_row]
         is_in_parameter_table = self._is_under_parameter_header and header_text[0] in table_header_parameter_columns
 
         if is_in_parameter_table:
-            table = EndpointFieldTable(node, self._is_parameter_required_by_header)
+            table = EndpointFieldTable(table_trs, header_text, self._is_parameter_required_by_header)
             if self._is_parameter_for_body:
                 self._request_body_tables.append(table)
             else:
                 self._url_params_tables.append(table)
-            documentation = table.documentation
+            table_text = table.documentation
         else:
-            table_text = [[node_text(td) for td in body_row] for body_row in table_trs]
-            documentation = format_table(table_text)
+            table_text = [header_text] + [[node_text(td) for td in body_row] for body_row in table_trs[1:]]
 
-        self._documentation_lines.extend(documentation)
+        format_table(table_text, self._documentation_lines)
         self._documentation_lines.append('')
         self._is_under_parameter_header = False
         self._is_parameter_required_by_header = False
@@ -373,34 +435,32 @@ class EndpointFunction:
         self._documentation_lines.extend(node_text(node).split('\n'))
         self._documentation_lines.append('')
 
-    def _parse_node(self):
-        for child in self._node.xpath(section_child_xpath):
-            if child.tag == 'div':
-                self._parse_div(child)
-            elif child.tag == 'h2' or child.tag == 'h3':
-                self._parse_header(child)
-            elif child.tag == 'p':
-                self._parse_paragraph(child)
-            elif child.tag == 'table':
-                self._parse_table(child)
-            elif child.tag == 'ul':
-                self._parse_list(child)
-            else:
-                raise Exception(f'Unhandled tag {child.tag!r} in section {self._node.xpath("h2[1]/text()")[0]!r}')
+    tag_parsers = {
+        'div': _parse_div,
+        'h2': _parse_header,
+        'h3': _parse_header,
+        'p': _parse_paragraph,
+        'table': _parse_table,
+        'ul': _parse_list,
+    }
 
-    @property
-    def function_name(self) -> str:
-        return self._node.xpath('h2[1]/@id')[0].replace('-', '_')
+    def _parse_node(self):
+        tag_parsers = self.tag_parsers
+        for child in section_child_xpath(self._node):
+            parse = tag_parsers.get(child.tag)
+            if parse is None:
+                raise Exception(f'Unhandled tag {child.tag!r} in section {section_title_xpath(self._node)[0]!r}')
+            parse(self, child)
 
     @property
     def function_parameters(self) -> str:
-        url_params = []
-        for table in self._url_params_tables:
-            url_params.extend(table.function_parameters(self.function_name))
-        body_params = []
-        for table in self._request_body_tables:
-            body_params.extend(table.function_parameters(self.function_name))
-        params_string = ', '.join(sorted(url_params) + sorted(body_params))
+        url_params = sorted(
+            param for table in self._url_params_tables for param in table.function_parameters(self.function_name)
+        )
+        body_params = sorted(
+            param for table in self._request_body_tables for param in table.function_parameters(self.function_name)
+        )
+        params_string = ', '.join(chain(url_params, body_params))
         return f', *, {params_string}' if params_string else ''
 
     @property
@@ -410,7 +470,7 @@ class EndpointFunction:
     @property
     def function_body(self) -> List[str]:
         code_lines = []
-        return_line = f'return await self._request({self._url_method.strip()!r}, {self._url_path!r}'
+        request_args = [repr(self._url_method.strip()), repr(self._url_path)]
 
         if self._url_params_tables:
             all_kwargs = []
@@ -420,7 +480,7 @@ class EndpointFunction:
                 all_kwargs.extend(table_kwargs)
             kwargs = ', '.join(sorted(all_kwargs))
             code_lines.append(f'params = exclude_non_empty({kwargs})')
-            return_line += ', params=params'
+            request_args.append('params=params')
 
         if self._request_body_tables:
             all_kwargs = []
@@ -430,9 +490,9 @@ class EndpointFunction:
                 all_kwargs.extend(table_kwargs)
             kwargs = ', '.join(sorted(all_kwargs))
             code_lines.append(f'data = exclude_non_empty({kwargs})')
-            return_line += ', data=data'
+            request_args.append('data=data')
 
-        code_lines.append(return_line + ')')
+        code_lines.append(f'return await self._request({", ".join(request_args)})')
         return code_lines
 
     @property
@@ -441,36 +501,117 @@ class EndpointFunction:
         return [def_line] + indent(self.function_docstring + self.function_body)
 
 
-def parse_document(document: HtmlElement) -> List[str]:
-    sections = document.xpath(sections_xpath)
+def fetch_reference(cache_file: Path) -> bytes:
+    """
+    Returns the API reference markup, revalidating the cached copy with a conditional GET.
+
+    A cache file without the sidecar metadata was placed by hand and is used as-is.
+    """
+    meta_file = cache_file.with_name(cache_file.name + '.meta')
+    if cache_file.exists() and not meta_file.exists():
+        return cache_file.read_bytes()
+
+    headers = {'Accept-Encoding': 'gzip'}
+    if cache_file.exists():
+        meta: Dict[str, str] = json.loads(meta_file.read_text())
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+
+    try:
+        with urlopen(Request(reference_url, headers=headers)) as response:
+            source: bytes = response.read()
+            if response.headers.get('Content-Encoding') == 'gzip':
+                source = gzip.decompress(source)
+            meta = {
+                'etag': response.headers.get('ETag', ''),
+                'last_modified': response.headers.get('Last-Modified', ''),
+            }
+    except HTTPError as e:
+        if e.code == 304 and cache_file.exists():
+            return cache_file.read_bytes()
+        raise
+
+    cache_file.write_bytes(source)
+    meta_file.write_text(json.dumps(meta))
+    return source
+
+
+def iter_sections(source: bytes) -> Iterator[HtmlElement]:
+    """
+    Yields the endpoint sections of the reference as they finish parsing.
+
+    Each section is cleared once the caller is done with it, along with everything parsed before it.
+    """
+    for _, section in iterparse(
+        BytesIO(source),
+        tag='section',
+        encoding='utf-8',
+        html=True,
+        collect_ids=False,
+        remove_comments=True,
+        remove_pis=True,
+    ):
+        if section.get('class') == 'left-docs' and section.find('h2') is not None:
+            yield section
+        section.clear()
+        while section.getprevious() is not None:
+            del section.getparent()[0]
+
+
+def section_function_code(section_markup: bytes) -> List[str]:
+    function = EndpointFunction(fromstring(section_markup))
+    return indent(function.function_code)
+
+
+def parse_document(sections: Iterable[HtmlElement]) -> List[str]:
+    # Sections are independent, so they are serialized and turned into functions in parallel. Serialized as HTML, since
+    # the reference can have attributes that aren't valid XML names. Only a few sections per worker are submitted ahead,
+    # so that the rest of the document is still parsed as it's needed rather than all held at once
     functions_lines = []
+    pending: Deque['Future[List[str]]'] = deque()
+    max_pending = (os.cpu_count() or 1) * 4
 
-    for section in sections:
+    def collect_next():
         functions_lines.append('')
-        function = EndpointFunction(section)
-        functions_lines.extend(indent(function.function_code))
+        functions_lines.extend(pending.popleft().result())
+
+    with ProcessPoolExecutor() as executor:
+        for section in sections:
+            pending.append(executor.submit(section_function_code, tostring(section, method='html', with_tail=False)))
+            if len(pending) >= max_pending:
+                collect_next()
+        while pending:
+            collect_next()
 
     return functions_lines
 
 
 if __name__ == '__main__':
     this_dir = Path(__file__).resolve().parent
-    possible_file = this_dir / 'reference.html'
-    if possible_file.exists():
-        source = possible_file.read_text()
-    else:
-        with urlopen('https://dev.twitch.tv/docs/api/reference') as response:
-            source = response.read()
-            if isinstance(source, bytes):
-                possible_file.write_bytes(source)
-            else:
-                possible_file.write_text(source)
-
-    markup = fromstring(source)
-    generated_lines = parse_document(markup)
-
+    target_file = this_dir.parent / 'green_eggs' / 'api' / 'direct.py'
+    source = fetch_reference(this_dir / 'reference.html')
     template = (this_dir / 'direct.py.template').read_text()
-    full_file = template + '\n'.join(generated_lines) + '\n'
-    for misspelled, corrected in spelling_fixes.items():
-        full_file = full_file.replace(misspelled, corrected)
-    (this_dir.parent / 'green_eggs' / 'api' / 'direct.py').write_text(full_file)
+
+    # The parsed lines only depend on the reference and this script, so editing the template doesn't need a re-parse
+    parsed_cache_file = this_dir / 'reference.parsed.json'
+    source_hash = hashlib.blake2b(source, digest_size=16)
+    source_hash.update(Path(__file__).read_bytes())
+    parsed_cache = json.loads(parsed_cache_file.read_text()) if parsed_cache_file.exists() else {}
+    if parsed_cache.get('hash') == source_hash.hexdigest():
+        generated_lines: List[str] = parsed_cache['lines']
+    else:
+        generated_lines = parse_document(iter_sections(source))
+        parsed_cache_file.write_text(json.dumps({'hash': source_hash.hexdigest(), 'lines': generated_lines}))
+
+    # Checked against the file itself rather than trusted, since it may have been edited by hand or changed branches
+    generated_text = fix_spelling(template) + ''.join(fix_spelling(line) + '\n' for line in generated_lines)
+    generated = generated_text.encode('utf-8')
+    if target_file.exists() and target_file.read_bytes() == generated:
+        sys.exit()
+
+    # Write next to the target and swap it in, so an interrupted run never leaves a partial module
+    partial_file = target_file.with_name(target_file.name + '.partial')
+    partial_file.write_bytes(generated)
+    os.replace(partial_file, target_file)
@@ -1,42 +1,77 @@
 # -*- coding: utf-8 -*-
 import asyncio
-import collections
 import json
+from operator import attrgetter
 from pathlib import Path
-import pprint
-from typing import Dict, List, Set, Type
+from typing import Callable, Dict, List, Set, Tuple, Type
 
 import aiologger
+from aiologger.levels import LogLevel
 
 from green_eggs import data_types as dt
 from green_eggs.api import TwitchApiDirect
 from green_eggs.client import TwitchChatClient
 
-repo_dir = Path(__file__).resolve().parent.parent
-secrets_file = repo_dir / 'secrets.json'
-secrets = json.loads(secrets_file.read_text())
-username = secrets['username']
-client_id = secrets['client_id']
-token = secrets['token']
-
+UnhandledHolder = Dict[Type[dt.HandleAble], Dict[str, Set[str]]]
+UnhandledSources = Tuple[Tuple[UnhandledHolder, str, Callable[[dt.HandleAble], Dict[str, str]]], ...]
 
 # Holders for actions later
-unhandled_tags: Dict[Type[dt.HandleAble], Dict[str, Set[str]]] = collections.defaultdict(
-    lambda: collections.defaultdict(set)
-)
-unhandled_badges: Dict[Type[dt.HandleAble], Dict[str, Set[str]]] = collections.defaultdict(
-    lambda: collections.defaultdict(set)
-)
-unhandled_badge_info: Dict[Type[dt.HandleAble], Dict[str, Set[str]]] = collections.defaultdict(
-    lambda: collections.defaultdict(set)
-)
-unhandled_msg_params: Dict[Type[dt.HandleAble], Dict[str, Set[str]]] = collections.defaultdict(
-    lambda: collections.defaultdict(set)
-)
-
-
-async def stress():
-    logger = aiologger.Logger.with_default_handlers(name='stress')
+unhandled_tags: UnhandledHolder = {}
+unhandled_badges: UnhandledHolder = {}
+unhandled_badge_info: UnhandledHolder = {}
+unhandled_msg_params: UnhandledHolder = {}
+
+unhandled_sources_by_type: Dict[Type[dt.HandleAble], UnhandledSources] = {}
+
+
+def unhandled_sources(handle_able: dt.HandleAble) -> UnhandledSources:
+    # Which unhandled mappings a handle-able has only depends on its type, so the type checks run once per type
+    handle_type = type(handle_able)
+    sources = unhandled_sources_by_type.get(handle_type)
+    if sources is None:
+        source_list = []
+        if isinstance(handle_able, dt.HasTags):
+            tags = handle_able.tags
+            source_list.append((unhandled_tags, 'tag', attrgetter('tags.unhandled')))
+            if isinstance(tags, dt.UserBaseTags):
+                source_list.append((unhandled_badges, 'badge', attrgetter('tags.badges.unhandled')))
+            if isinstance(tags, dt.UserChatBaseTags):
+                source_list.append((unhandled_badge_info, 'badge info', attrgetter('tags.badge_info.unhandled')))
+            if isinstance(tags, dt.UserNoticeTags):
+                source_list.append((unhandled_msg_params, 'msg_param', attrgetter('tags.msg_params.unhandled')))
+        sources = unhandled_sources_by_type[handle_type] = tuple(source_list)
+    return sources
+
+
+def record_unhandled(holder: UnhandledHolder, handle_type: Type[dt.HandleAble], label: str, unhandled: Dict[str, str]):
+    if not unhandled:
+        return
+
+    recorded = holder.get(handle_type)
+    if recorded is None:
+        recorded = holder[handle_type] = {}
+    for key, value in unhandled.items():
+        values = recorded.get(key)
+        if values is None:
+            print(f'Unhandled {handle_type.__name__} {label}: {key!r}')
+            values = recorded[key] = set()
+        values.add(value)
+
+
+def print_unhandled(title: str, holder: UnhandledHolder):
+    if holder:
+        print(title)
+        # The stdlib json encoder is several times faster than pprint on a long run's worth of values
+        report = {
+            type_.__qualname__: {key: sorted(values) for key, values in unhandled.items()}
+            for type_, unhandled in holder.items()
+        }
+        print(json.dumps(report, indent=2, sort_keys=True))
+
+
+async def stress(*, username: str, client_id: str, token: str):
+    # Below warnings, the client's per-join and per-request messages are only noise next to this runner's own output
+    logger = aiologger.Logger.with_default_handlers(name='stress', level=LogLevel.WARNING)
     logins: List[str] = []
 
     async with TwitchApiDirect(client_id=client_id, token=token, logger=logger) as api:
@@ -45,77 +80,46 @@ async def stress():
     logins.extend(stream['user_login'] for stream in streams['data'])
 
     async with TwitchChatClient(username=username, token=token, logger=logger) as chat:
-        for login in logins:
-            await chat.join(login)
+        await asyncio.gather(*(chat.join(login) for login in logins))
 
         async for raw, timestamp in chat.incoming():
-            for handle_type, pattern in dt.patterns.items():
-                match_result = pattern.match(raw)
-                if match_result is not None:
-                    # TODO curses view
-                    try:
-                        handle_able = handle_type.from_match_dict(
-                            default_timestamp=timestamp, raw=raw, **match_result.groupdict()
-                        )
-                    except Exception as e:
-                        print('Error handling matched message')
-                        print(f'- HandleAble type: {handle_type.__qualname__}\nRaw message: {raw!r}')
-                        print(f'- {e}')
-                    else:
-                        # Actions here
-                        if isinstance(handle_able, dt.HasTags):
-                            for key, value in handle_able.tags.unhandled.items():
-                                if key not in unhandled_tags[handle_type]:
-                                    print(f'Unhandled {handle_type.__name__} tag: {key!r}')
-                                unhandled_tags[handle_type][key].add(value)
-
-                            if isinstance(handle_able.tags, dt.UserBaseTags):
-                                for key, value in handle_able.tags.badges.unhandled.items():
-                                    if key not in unhandled_badges[handle_type]:
-                                        print(f'Unhandled {handle_type.__name__} badge: {key!r}')
-                                    unhandled_badges[handle_type][key].add(value)
-
-                            if isinstance(handle_able.tags, dt.UserChatBaseTags):
-                                for key, value in handle_able.tags.badge_info.unhandled.items():
-                                    if key not in unhandled_badge_info[handle_type]:
-                                        print(f'Unhandled {handle_type.__name__} badge info: {key!r}')
-                                    unhandled_badge_info[handle_type][key].add(value)
-
-                            if isinstance(handle_able.tags, dt.UserNoticeTags):
-                                for key, value in handle_able.tags.msg_params.unhandled.items():
-                                    if key not in unhandled_msg_params[handle_type]:
-                                        print(f'Unhandled {handle_type.__name__} msg_param: {key!r}')
-                                    unhandled_msg_params[handle_type][key].add(value)
+            matched = dt.match_handle_type(raw)
+            if matched is not None:
+                handle_type, match_dict = matched
+                # TODO curses view
+                try:
+                    handle_able = handle_type.from_match_dict(default_timestamp=timestamp, raw=raw, **match_dict)
+                except Exception as e:
+                    print('Error handling matched message')
+                    print(f'- HandleAble type: {handle_type.__qualname__}\nRaw message: {raw!r}')
+                    print(f'- {e}')
+                else:
+                    # Actions here
+                    for holder, label, get_unhandled in unhandled_sources(handle_able):
+                        record_unhandled(holder, handle_type, label, get_unhandled(handle_able))
 
 
 if __name__ == '__main__':
-    loop = asyncio.get_event_loop()
-    task = None
+    repo_dir = Path(__file__).resolve().parent.parent
+    secrets = json.loads((repo_dir / 'secrets.json').read_bytes())
+
+    try:
+        # Optional, a faster event loop if it's installed
+        import uvloop
+    except ImportError:
+        pass
+    else:
+        uvloop.install()
+
     try:
-        task = loop.create_task(stress())
-        loop.run_until_complete(task)
+        # Cancels and waits on everything still running when it's interrupted
+        asyncio.run(stress(username=secrets['username'], client_id=secrets['client_id'], token=secrets['token']))
     except KeyboardInterrupt:
-        if task:
-            task.cancel()
+        pass
     finally:
         print()  # jump past the ^C in the terminal
 
-        if unhandled_tags:
-            print('Unhandled tags:')
-            pprint.pprint({type_.__qualname__: dict(unhandled) for type_, unhandled in list(unhandled_tags.items())})
-        if unhandled_badges:
-            print('Unhandled badges:')
-            pprint.pprint({type_.__qualname__: dict(unhandled) for type_, unhandled in list(unhandled_badges.items())})
-        if unhandled_badge_info:
-            print('Unhandled badge info:')
-            pprint.pprint(
-                {type_.__qualname__: dict(unhandled) for type_, unhandled in list(unhandled_badge_info.items())}
-            )
-        if unhandled_msg_params:
-            print('Unhandled msg_params:')
-            pprint.pprint(
-                {type_.__qualname__: dict(unhandled) for type_, unhandled in list(unhandled_msg_params.items())}
-            )
-
-        pending = asyncio.all_tasks(loop=loop)
-        loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+        print_unhandled('Unhandled tags:', unhandled_tags)
+        print_unhandled('Unhandled badges:', unhandled_badges)
+        print_unhandled('Unhandled badge info:', unhandled_badge_info)
+        print_unhandled('Unhandled msg_params:', unhandled_msg_params)
@@ -7,6 +7,8 @@ from green_eggs.channel import Channel
 from green_eggs.config import LinkAllowUserConditions
 from green_eggs.data_types import PrivMsg
 
+dice_regex = re.compile(r'(?P<count>\d*)d(?P<sides>\d+)')
+
 bot = ChatBot(
     channel='your_channel_goes_here',
     config=dict(
@@ -30,7 +32,6 @@ bot.register_basic_commands(
 
 @bot.register_command('!roll', global_cooldown=2)
 def roll(message: PrivMsg):
-    dice_regex = re.compile(r'(?P<count>\d*)d(?P<sides>\d+)')
     spec = message.words[1] if len(message.words) >= 2 else '1d20'
     match_result = dice_regex.match(spec)
     if match_result is not None:
@@ -39,7 +40,10 @@ def roll(message: PrivMsg):
 
         if count > 0 and sides > 1:
             response = f'{message.tags.display_name} rolled {count} d{sides} and got '
-            roll_result = [random.randint(1, sides) for _ in range(count)]
+            if count == 1:
+                roll_result = [random.randint(1, sides)]
+            else:
+                roll_result = random.choices(range(1, sides + 1), k=count)
             total = sum(roll_result)
 
             if count == 1:
@@ -59,9 +63,7 @@ def roll(message: PrivMsg):
 
 @bot.register_command('!calm', user_cooldown=10)
 async def calm(channel: Channel):
-    await channel.send('EVERYBODY PANIC!')
-    await channel.send('/me =============\\o\\')
-    await channel.send('/me /o/=============')
+    await channel.send_many(['EVERYBODY PANIC!', '/me =============\\o\\', '/me /o/============='])
 
 
 @bot.register_caster_command('!caster')
@@ -70,4 +72,12 @@ def caster(display_name: str, user_link: str, game_name: str):
 
 
 if __name__ == '__main__':
+    try:
+        # Optional, a faster event loop if it's installed
+        import uvloop
+    except ImportError:
+        pass
+    else:
+        uvloop.install()
+
     bot.run_sync(chat_bot_username='bot_username', chat_bot_token='oauth:bot_token', api_token='api_token')
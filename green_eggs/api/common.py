@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 from dataclasses import dataclass
 from types import TracebackType
-from typing import Any, Dict, Optional, Type
+from typing import Any, Dict, Mapping, Optional, Type
 
 from aiohttp import ClientResponseError, ClientSession
 from aiologger import Logger
@@ -45,8 +45,18 @@ class ShoutoutInfo:
 
 
 class TwitchApiCommon:
-    def __init__(self, *, client_id: str, token: str, logger: Logger):
-        self._api = TwitchApiDirect(client_id=client_id, token=token, logger=logger)
+    def __init__(
+        self,
+        *,
+        client_id: str,
+        token: str,
+        logger: Logger,
+        pool_limit: int = 30,
+        get_cache_ttls: Optional[Mapping[str, float]] = None,
+    ):
+        self._api = TwitchApiDirect(
+            client_id=client_id, token=token, logger=logger, pool_limit=pool_limit, get_cache_ttls=get_cache_ttls
+        )
         self._logger: Logger = logger
 
     @property
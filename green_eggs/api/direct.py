@@ -1,14 +1,24 @@
 # -*- coding: utf-8 -*-
+import asyncio
+from collections import OrderedDict
+from dataclasses import dataclass
+import functools
+import importlib.util
+import time
 from types import TracebackType
-from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Type, Union
-from urllib.parse import urlencode
+from typing import Any, Awaitable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Type, Union
 
 import aiohttp
 from aiologger import Logger
+from aiologger.levels import LogLevel
+from yarl import URL
 
 __all__ = ('TwitchApiDirect',)
 
 _empty: Any = object()
+# aiohttp 3.8 only asks for gzip and deflate on its own, but it can decode brotli, which is smaller for JSON, when the
+# package from its speedups is installed
+_accept_encoding = 'gzip, deflate, br' if importlib.util.find_spec('brotli') is not None else 'gzip, deflate'
 UrlParams = Union[
     Mapping[Any, Any],
     Mapping[Any, Sequence[Any]],
@@ -21,14 +31,71 @@ def exclude_non_empty(**kwargs):
     return {k: v for k, v in kwargs.items() if v is not _empty}
 
 
+def query_pairs(params: UrlParams) -> List[Tuple[str, str]]:
+    # Same pairs as `urlencode(params, doseq=True)` would encode, but with booleans lowercase for helix
+    pairs = params.items() if isinstance(params, Mapping) else params
+    query = []
+    for key, value in pairs:
+        key = str(key)
+        # Any other iterable, like a set of IDs, is also repeated under its key
+        is_single = isinstance(value, (str, bytes)) or not isinstance(value, Iterable)
+        for v in (value,) if is_single else value:
+            # Identity checks, since a lookup table would also catch 1 and 0, and these are cheaper than `isinstance`
+            query.append((key, 'true' if v is True else 'false' if v is False else str(v)))
+    return query
+
+
+@dataclass
+class _InFlightGet:
+    task: 'asyncio.Future[Any]'
+    waiters: int = 0
+
+
 class TwitchApiDirect:
-    _base_url = 'https://api.twitch.tv/helix/'
+    _base_url = URL('https://api.twitch.tv/helix/')
+    # The most GET responses kept at once, least recently used dropped first
+    _get_cache_max_size = 1024
 
-    def __init__(self, *, client_id: str, token: str, logger: Logger):
-        token = token.lstrip('oauth:')
-        headers = {'Client-ID': client_id, 'Authorization': f'Bearer {token}'}
+    def __init__(
+        self,
+        *,
+        client_id: str,
+        token: str,
+        logger: Logger,
+        pool_limit: int = 30,
+        get_cache_ttls: Optional[Mapping[str, float]] = None,
+    ):
+        self._headers: Dict[str, str] = {'Client-ID': client_id}
         self._logger: Logger = logger
-        self._session: aiohttp.ClientSession = aiohttp.ClientSession(headers=headers)
+        self._pool_limit: int = pool_limit
+        # Seconds to reuse GET responses for, by helix path. Responses are keyed by their full URL, query included
+        self._get_cache_ttls: Dict[str, float] = dict(get_cache_ttls or {})
+        self._get_cache: 'OrderedDict[URL, Tuple[float, Any]]' = OrderedDict()
+        # GETs that are being sent right now, so that identical ones made meanwhile wait for the same response
+        self._in_flight_gets: Dict[URL, _InFlightGet] = dict()
+        # What helix last reported of its rate limit bucket: its size, the requests left, and the epoch second it
+        # refills at. Starts at helix's default bucket size until a response gives the real numbers
+        self._ratelimit_limit: int = 800
+        self._ratelimit_remaining: int = 800
+        self._ratelimit_reset: float = 0.0
+        # Endpoint paths are fixed, so each one is only joined onto the base URL once
+        self._path_urls: Dict[str, URL] = dict()
+        # Created when entering the context, so that it belongs to the running event loop
+        self._session: Optional[aiohttp.ClientSession] = None
+        self.set_token(token)
+
+    def set_token(self, token: str):
+        """
+        Replaces the OAuth token that requests are authorized with, such as after it's refreshed.
+
+        An open session is kept, and only its default headers are updated, so that its pooled connections stay warm.
+
+        :param str token: The new OAuth token
+        """
+        token = token[len('oauth:') :] if token.startswith('oauth:') else token
+        self._headers['Authorization'] = f'Bearer {token}'
+        if self._session is not None:
+            self._session.headers['Authorization'] = self._headers['Authorization']
 
     async def _request(
         self,
@@ -44,28 +111,156 @@ class TwitchApiDirect:
 
         :param str method: The HTTP method
         :param str path: The helix API path
-        :param params: The params for `urlencode`
+        :param params: The params for the query string
         :param data: The data for the request body
         :param bool raise_for_status:
         :return:
+        :raises RuntimeError: if not used as an async context manager
         """
-        url = self._base_url + path
+        if self._session is None:
+            raise RuntimeError(f'{type(self).__name__} must be entered with `async with` before making requests')
+
+        # Built as a URL object here so that aiohttp doesn't need to parse and requote a string
+        try:
+            url = self._path_urls[path]
+        except KeyError:
+            url = self._path_urls[path] = self._base_url / path
         if params is not _empty and params:
-            if isinstance(params, Mapping):
-                params = {k: str(v).lower() if isinstance(v, bool) else v for k, v in params.items()}
-            url += f'?{urlencode(params, doseq=True)}'
+            url = url.with_query(query_pairs(params))
+
+        # Only responses that are known not to be errors are shared, whether cached or coalesced
+        shareable = method == 'GET' and raise_for_status and data is None
+        cache_ttl = self._get_cache_ttls.get(path) if shareable else None
+        if cache_ttl is not None:
+            cached = self._get_cache.get(url)
+            if cached is not None:
+                # Expired entries are dropped when they're next looked up, or pushed out by the size limit
+                if cached[0] > time.monotonic():
+                    self._get_cache.move_to_end(url)
+                    if self._logger.is_enabled_for(LogLevel.DEBUG):
+                        self._logger.debug(f'Using cached {method} response for {url}')
+                    return cached[1]
+                del self._get_cache[url]
+
+        if shareable:
+            in_flight = self._in_flight_gets.get(url)
+            if in_flight is None:
+                task = asyncio.ensure_future(self._send(self._session, method, url, data, raise_for_status))
+                in_flight = self._in_flight_gets[url] = _InFlightGet(task)
+                task.add_done_callback(functools.partial(self._in_flight_get_done, url, in_flight))
+            elif self._logger.is_enabled_for(LogLevel.DEBUG):
+                self._logger.debug(f'Waiting on in-flight {method} request to {url}')
+            in_flight.waiters += 1
+            try:
+                # Shielded so that one waiter being cancelled doesn't cancel the request for the others
+                response_data = await asyncio.shield(in_flight.task)
+            finally:
+                in_flight.waiters -= 1
+                # With nobody left to use the response, it isn't worth a pool connection and a rate limit token
+                if not in_flight.waiters and not in_flight.task.done():
+                    in_flight.task.cancel()
+                    self._forget_in_flight_get(url, in_flight)
+        else:
+            response_data = await self._send(self._session, method, url, data, raise_for_status)
+
+        if cache_ttl is not None:
+            self._get_cache[url] = (time.monotonic() + cache_ttl, response_data)
+            self._get_cache.move_to_end(url)
+            if len(self._get_cache) > self._get_cache_max_size:
+                self._get_cache.popitem(last=False)
+
+        return response_data
+
+    def _forget_in_flight_get(self, url: URL, in_flight: _InFlightGet):
+        # Only if it's still the one for this URL, since a new request may have taken its place
+        if self._in_flight_gets.get(url) is in_flight:
+            del self._in_flight_gets[url]
 
-        self._logger.debug(f'Making {method} request to {url}')
+    def _in_flight_get_done(self, url: URL, in_flight: _InFlightGet, task: 'asyncio.Future[Any]'):
+        self._forget_in_flight_get(url, in_flight)
+        # Retrieved so that a failure with no waiters left isn't logged as never retrieved
+        if not task.cancelled():
+            task.exception()
 
-        async with self._session.request(method, url, json=data) as response:
+    async def _send(
+        self,
+        session: aiohttp.ClientSession,
+        method: str,
+        url: URL,
+        data: Optional[Dict[str, Any]],
+        raise_for_status: bool,
+    ) -> Any:
+        # Waits out an empty bucket here, rather than sending requests that helix would only reject with a 429
+        while self._ratelimit_remaining < 1:
+            delay = self._ratelimit_reset - time.time()
+            if delay > 0:
+                self._logger.warning(f'Helix rate limit reached, waiting {delay:.1f} seconds')
+                await asyncio.sleep(delay)
+            else:
+                # Full again once reset, and helix refills each minute, until a response gives the real numbers
+                self._ratelimit_remaining = self._ratelimit_limit
+                self._ratelimit_reset = time.time() + 60
+        # Counted down as requests go out, so that many sent at once can't all pass on the same last request
+        self._ratelimit_remaining -= 1
+
+        # Checked first so that the message, and the URL's string, aren't built just to be dropped
+        if self._logger.is_enabled_for(LogLevel.DEBUG):
+            self._logger.debug(f'Making {method} request to {url}')
+
+        async with session.request(method, url, json=data) as response:
+            remaining = response.headers.get('Ratelimit-Remaining')
+            if remaining is not None:
+                self._ratelimit_limit = int(response.headers.get('Ratelimit-Limit', self._ratelimit_limit))
+                self._ratelimit_remaining = int(remaining)
+                self._ratelimit_reset = float(response.headers.get('Ratelimit-Reset', 0))
             if raise_for_status:
                 response.raise_for_status()
-            response_data = await response.json()
+            return await response.json()
 
-        return response_data
+    async def gather(self, *aws: Awaitable[Any], concurrency: Optional[int] = None) -> List[Any]:
+        """
+        Awaits many endpoint calls concurrently, with at most `concurrency` of them in flight at once.
+
+        Results are returned in the order the awaitables were given. Coroutines beyond the limit aren't started until
+        others finish, so a large batch doesn't queue up every request on the connection pool at once.
+
+        :param aws: The endpoint calls to await
+        :param concurrency: The most to run at once. Defaults to the connection pool limit
+        :type concurrency: int or None
+        :return: The results of the awaitables
+        :rtype: List[Any]
+        """
+        semaphore = asyncio.Semaphore(concurrency or self._pool_limit)
+
+        async def limited(aw: Awaitable[Any]) -> Any:
+            async with semaphore:
+                return await aw
+
+        return await asyncio.gather(*map(limited, aws))
 
     async def __aenter__(self) -> 'TwitchApiDirect':
-        self._session = await self._session.__aenter__()
+        if self._session is not None:
+            raise RuntimeError(f'{type(self).__name__} is already entered, and must be exited before entering again')
+
+        # Every request goes to the one helix host, so the pool limit is also the per-host limit, and its address can be
+        # cached for much longer than the default 10 seconds. Lookups use aiodns, from aiohttp's speedups, rather than
+        # the default threadpool resolver
+        connector = aiohttp.TCPConnector(
+            limit=self._pool_limit,
+            limit_per_host=self._pool_limit,
+            ttl_dns_cache=600,
+            keepalive_timeout=60,
+            resolver=aiohttp.AsyncResolver(),
+        )
+        headers = {**self._headers, 'Accept-Encoding': _accept_encoding}
+        try:
+            session = aiohttp.ClientSession(headers=headers, connector=connector)
+        except Exception:
+            # The session would have owned the connector, so nothing else is left to close it
+            await connector.close()
+            raise
+        self._session = await session.__aenter__()
+
         return self
 
     async def __aexit__(
@@ -74,7 +269,9 @@ class TwitchApiDirect:
         exc_val: Optional[BaseException],
         exc_tb: Optional[TracebackType],
     ):
-        await self._session.__aexit__(exc_type, exc_val, exc_tb)
+        if self._session is not None:
+            await self._session.__aexit__(exc_type, exc_val, exc_tb)
+            self._session = None
 
     # API endpoint functions
 
@@ -33,11 +33,10 @@ async def _main_handler(
 ) -> Optional[dt.HandleAble]:
     handle_able: Optional[dt.HandleAble] = None
 
-    for handle_type, pattern in dt.patterns.items():
-        found = pattern.match(raw)
-        if found is not None:
-            handle_able = handle_type.from_match_dict(default_timestamp=default_timestamp, raw=raw, **found.groupdict())
-            break
+    matched = dt.match_handle_type(raw)
+    if matched is not None:
+        handle_type, match_dict = matched
+        handle_able = handle_type.from_match_dict(default_timestamp=default_timestamp, raw=raw, **match_dict)
 
     if handle_able is None:
         logger.warning(f'Incoming message could not be parsed: {raw!r}')
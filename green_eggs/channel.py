@@ -2,7 +2,7 @@
 import asyncio
 from collections import defaultdict, deque
 from logging import Logger
-from typing import Any, Deque, Dict, Optional, Set
+from typing import Any, Deque, Dict, Iterable, Optional, Set
 
 from green_eggs import constants as const
 from green_eggs.api import TwitchApiCommon
@@ -261,13 +261,29 @@ class Channel:
             None,
         )
 
+    def _privmsg_line(self, message: str) -> str:
+        message = message.rstrip()
+        if len(message) > const.MESSAGE_MAX_LENGTH:
+            raise ValueError(f'Messages cannot exceed {const.MESSAGE_MAX_LENGTH} characters')
+        return f'PRIVMSG #{self._login} :{message}'
+
     async def send(self, message: str):
         """
         Sends a message to this channel's chat.
 
         :param str message: The message to send. Can be a command if it starts with `'/'`
         """
-        message = message.rstrip()
-        if len(message) > const.MESSAGE_MAX_LENGTH:
-            raise ValueError(f'Messages cannot exceed {const.MESSAGE_MAX_LENGTH} characters')
-        await self._chat.send(f'PRIVMSG #{self._login} :{message}')
+        await self._chat.send(self._privmsg_line(message))
+
+    async def send_many(self, messages: Iterable[str]):
+        """
+        Sends several messages to this channel's chat, in order, in one write to the server.
+
+        Nothing is sent if any of the messages is too long.
+
+        :param messages: The messages to send. Each can be a command if it starts with `'/'`
+        :type messages: Iterable[str]
+        """
+        lines = [self._privmsg_line(message) for message in messages]
+        if lines:
+            await self._chat.send('\r\n'.join(lines))
@@ -1,9 +1,11 @@
 # -*- coding: utf-8 -*-
 from dataclasses import dataclass, field, fields
 import datetime
+import functools
 import keyword
 import re
-from typing import Any, Callable, ClassVar, Dict, Generator, List, Optional, Pattern, Tuple, Type
+import sys
+from typing import Any, Callable, ClassVar, Dict, Generator, List, Match, Optional, Pattern, Tuple, Type
 
 from green_eggs import constants as const
 
@@ -17,6 +19,9 @@ _unescape_lookup: Dict[str, str] = {
 }
 
 
+# Tag, badge, and msg param names mostly come from a small vocabulary, so each one is usually only cleaned once. Bounded,
+# since the names come from the server and new ones can turn up for as long as a bot runs
+@functools.lru_cache(maxsize=1024)
 def _clean_for_attribute(inp: str) -> str:
     """
     Cleans a potentially unsafe string for attribute assignment.
@@ -31,8 +36,7 @@ def _clean_for_attribute(inp: str) -> str:
     snake_case = _camel_kebab_to_snake_pattern.sub('_', inp).lower()
     keyword_safe = f'{snake_case}_' if keyword.iskeyword(snake_case) else snake_case
     numeric_safe = f'num_{keyword_safe}' if keyword_safe[0].isdecimal() else keyword_safe
-
-    return numeric_safe
+    return sys.intern(numeric_safe)
 
 
 def _irc_v3_unescape_iter(raw: str) -> Generator[str, None, None]:
@@ -668,11 +672,17 @@ class HasTags(HandleAble):
 
     @classmethod
     def from_match_dict(cls, **kwargs) -> HandleAble:
-        tags_type: Type[BaseTags] = next(f.type for f in fields(cls) if f.name == 'tags')
+        tags_type = _tags_types.get(cls)
+        if tags_type is None:
+            tags_type = _tags_types[cls] = next(f.type for f in fields(cls) if f.name == 'tags')
 
         return super().from_match_dict(tags=tags_type.from_raw_data(kwargs.pop('tags')), **kwargs)
 
 
+# The tags type of each handle-able, looked up from its fields the first time one is built
+_tags_types: Dict[Type[HasTags], Type[BaseTags]] = {}
+
+
 @dataclass(frozen=True)
 class InChannel(HandleAble):
     where: str
@@ -895,3 +905,46 @@ patterns: Dict[Type[HandleAble], Pattern[str]] = {
     Code366: const.CODE_366_PATTERN,
     Whisper: const.WHISPER_PATTERN,
 }
+
+# The IRC command each pattern is anchored on, so only one pattern has to be tried per message
+_pattern_commands: Dict[Type[HandleAble], Tuple[str, ...]] = {
+    PrivMsg: ('PRIVMSG',),
+    JoinPart: ('JOIN', 'PART'),
+    ClearChat: ('CLEARCHAT',),
+    UserNotice: ('USERNOTICE',),
+    RoomState: ('ROOMSTATE',),
+    UserState: ('USERSTATE',),
+    ClearMsg: ('CLEARMSG',),
+    Notice: ('NOTICE',),
+    HostTarget: ('HOSTTARGET',),
+    Code353: ('353',),
+    Code366: ('366',),
+    Whisper: ('WHISPER',),
+}
+_command_matchers: Dict[str, Tuple[Type[HandleAble], Callable[[str], Optional[Match[str]]]]] = {
+    command: (handle_type, pattern.match)
+    for handle_type, pattern in patterns.items()
+    for command in _pattern_commands[handle_type]
+}
+
+
+def match_handle_type(raw: str) -> Optional[Tuple[Type[HandleAble], Dict[str, Any]]]:
+    """
+    Find the data type a raw IRC message should be handled as.
+
+    Returns the type and the match groups to pass to its `from_match_dict`, or None if no pattern matches.
+    """
+    # The command follows the prefix, which follows the tags if there are any. Lines that don't have that shape can't
+    # match any pattern, so whatever gets sliced out of them only has to miss the lookup
+    start = raw.find(' ') + 1
+    if raw.startswith('@'):
+        start = raw.find(' ', start) + 1
+    command_matcher = _command_matchers.get(raw[start : raw.find(' ', start)])
+    if command_matcher is None:
+        return None
+
+    handle_type, match = command_matcher
+    found = match(raw)
+    if found is None:
+        return None
+    return handle_type, found.groupdict()
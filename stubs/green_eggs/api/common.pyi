@@ -1,5 +1,5 @@
 from types import TracebackType
-from typing import Any, Dict, Optional, Type
+from typing import Any, Dict, Mapping, Optional, Type
 
 from aiologger import Logger
 
@@ -23,7 +23,15 @@ class ShoutoutInfo:
     ) -> None: ...
 
 class TwitchApiCommon:
-    def __init__(self, *, client_id: str, token: str, logger: Logger) -> None: ...
+    def __init__(
+        self,
+        *,
+        client_id: str,
+        token: str,
+        logger: Logger,
+        pool_limit: int = ...,
+        get_cache_ttls: Optional[Mapping[str, float]] = ...,
+    ) -> None: ...
     @property
     def direct(self) -> TwitchApiDirect: ...
     async def __aenter__(self) -> TwitchApiCommon: ...
@@ -1,5 +1,5 @@
 from types import TracebackType
-from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Type, Union
+from typing import Any, Awaitable, Dict, List, Mapping, Optional, Sequence, Tuple, Type, Union
 
 from aiologger import Logger
 
@@ -8,7 +8,17 @@ UrlParams = Union[
 ]
 
 class TwitchApiDirect:
-    def __init__(self, *, client_id: str, token: str, logger: Logger) -> None: ...
+    def __init__(
+        self,
+        *,
+        client_id: str,
+        token: str,
+        logger: Logger,
+        pool_limit: int = ...,
+        get_cache_ttls: Optional[Mapping[str, float]] = ...,
+    ) -> None: ...
+    def set_token(self, token: str): ...
+    async def gather(self, *aws: Awaitable[Any], concurrency: Optional[int] = ...) -> List[Any]: ...
     async def __aenter__(self) -> TwitchApiDirect: ...
     async def __aexit__(
         self, exc_type: Optional[Type[BaseException]], exc_val: Optional[BaseException], exc_tb: Optional[TracebackType]
@@ -1,5 +1,5 @@
 from logging import Logger
-from typing import Optional
+from typing import Iterable, Optional
 
 from green_eggs.api import TwitchApiCommon as TwitchApiCommon
 from green_eggs.client import TwitchChatClient as TwitchChatClient
@@ -30,3 +30,4 @@ class Channel:
     def is_user_vip(self, user_id: str) -> bool: ...
     def user_latest_message(self, user: str) -> Optional[PrivMsg]: ...
     async def send(self, message: str): ...
+    async def send_many(self, messages: Iterable[str]): ...
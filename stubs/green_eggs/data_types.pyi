@@ -639,3 +639,5 @@ class Whisper(HasMessage, HasTags, UserInChannel):
     def __init__(self, default_timestamp, raw, where, who, tags, message) -> None: ...
 
 patterns: Dict[Type[HandleAble], Pattern[str]]
+
+def match_handle_type(raw: str) -> Optional[Tuple[Type[HandleAble], Dict[str, Any]]]: ...
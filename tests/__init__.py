@@ -74,8 +74,9 @@ async def mock_socket(**k):
 
 
 class MockResponse:
-    def __init__(self, return_json=None):
+    def __init__(self, return_json=None, headers=None):
         self._return_json = return_json or dict(foo='bar')
+        self.headers = headers or dict()
 
     async def json(self):
         return self._return_json
@@ -86,5 +87,5 @@ class MockResponse:
 
 
 @contextlib.asynccontextmanager
-async def response_context(return_json=None):
-    yield MockResponse(return_json=return_json)
+async def response_context(return_json=None, headers=None):
+    yield MockResponse(return_json=return_json, headers=headers)
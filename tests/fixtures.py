@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 import pytest
 from pytest_mock import MockerFixture
+from yarl import URL
 
 from green_eggs.api import TwitchApiCommon, TwitchApiDirect
 from green_eggs.channel import Channel
@@ -16,7 +17,7 @@ async def api_common(mocker: MockerFixture):
     mocker.patch('aiohttp.ClientSession.request', return_value=response_context())
 
     async with TwitchApiCommon(client_id='test client', token='test token', logger=logger) as api_client:
-        api_client.direct._base_url = 'base/'
+        api_client.direct._base_url = URL('base/')
         yield api_client
 
 
@@ -25,7 +26,7 @@ async def api_direct(mocker: MockerFixture):
     mocker.patch('aiohttp.ClientSession.request', return_value=response_context())
 
     async with TwitchApiDirect(client_id='test client', token='test token', logger=logger) as api_client:
-        api_client._base_url = 'base/'
+        api_client._base_url = URL('base/')
         yield api_client
 
 
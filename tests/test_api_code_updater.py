@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+from concurrent.futures import ThreadPoolExecutor
+import importlib.util
+from pathlib import Path
+
+from pytest_mock import MockerFixture
+
+_updater_path = Path(__file__).resolve().parent.parent / 'dev-runners' / 'api-code-updater.py'
+_updater_spec = importlib.util.spec_from_file_location('api_code_updater', _updater_path)
+assert _updater_spec is not None and _updater_spec.loader is not None
+updater = importlib.util.module_from_spec(_updater_spec)
+_updater_spec.loader.exec_module(updater)
+
+reference = b'''<html><body>
+<section class="left-docs"><h2 id="get-things">Get Things</h2>
+<div>Gets <svg><use xlink:href="#thing"/></svg>things.</div>
+<p :foo="1" x:y="2">Not valid XML attribute names.</p>
+<h3>URL</h3><p>`GET https://api.twitch.tv/helix/things`</p>
+<h3>Request Query Parameters</h3>
+<table><thead><tr><th>Parameter</th><th>Type</th><th>Description</th></tr></thead><tbody>
+<tr><td>id</td><td>String</td><td>Thing ID.</td></tr></tbody></table>
+</section>
+</body></html>'''
+
+
+def test_parse_document_html_attributes(mocker: MockerFixture):
+    # Threads stand in for processes, which the test can't load this module into by name
+    mocker.patch.object(updater, 'ProcessPoolExecutor', ThreadPoolExecutor)
+    lines = updater.parse_document(updater.iter_sections(reference))
+    assert lines[0] == ''
+    assert lines[1] == '    async def get_things(self, *, id_: str = _empty):'
+    assert '        Not valid XML attribute names.' in lines
+    assert lines[-2:] == [
+        '        params = exclude_non_empty(id=id_)',
+        "        return await self._request('GET', 'things', params=params)",
+    ]
@@ -1,35 +1,67 @@
 # -*- coding: utf-8 -*-
+import asyncio
+import contextlib
+from types import SimpleNamespace
+
+import aiohttp
 import pytest
 from pytest_mock import MockerFixture
+from yarl import URL
 
 from green_eggs.api import TwitchApiDirect
+from tests import MockResponse, logger, response_context
 from tests.fixtures import *  # noqa
 
 
 async def test_basic(api_direct: TwitchApiDirect):
     result = await api_direct._request('method', 'path')
-    api_direct._session.request.assert_called_once_with('method', 'base/path', json=None)  # type: ignore[attr-defined]
+    api_direct._session.request.assert_called_once_with('method', URL('base/path'), json=None)  # type: ignore[union-attr]
     assert result == dict(foo='bar')
 
 
+async def test_path_url_reused(mocker: MockerFixture):
+    mocker.patch('aiohttp.ClientSession.request', side_effect=lambda *args, **kwargs: response_context())
+    async with TwitchApiDirect(client_id='test client', token='test token', logger=logger) as api:
+        await api._request('method', 'path')
+        await api._request('method', 'path')
+        first_call, second_call = api._session.request.call_args_list  # type: ignore[union-attr]
+        assert first_call.args[1] is second_call.args[1]
+
+
 async def test_params(api_direct: TwitchApiDirect):
     result = await api_direct._request('method', 'path', params=dict(a=1, b=['hello', 'world']))
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'method', 'base/path?a=1&b=hello&b=world', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'method', URL('base/path?a=1&b=hello&b=world'), json=None
+    )
+    assert result == dict(foo='bar')
+
+
+async def test_params_pairs(api_direct: TwitchApiDirect):
+    result = await api_direct._request('method', 'path', params=[('a', True), ('b', ['hello', False]), ('c', 'x y')])
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'method', URL('base/path?a=true&b=hello&b=false&c=x+y'), json=None
+    )
+    assert result == dict(foo='bar')
+
+
+async def test_params_iterables(api_direct: TwitchApiDirect):
+    result = await api_direct._request('method', 'path', params=dict(id={'1'}, login=iter(['a', 'b']), name='xy'))
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'method', URL('base/path?id=1&login=a&login=b&name=xy'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_empty_params(api_direct: TwitchApiDirect):
     result = await api_direct._request('method', 'path', params=dict())
-    api_direct._session.request.assert_called_once_with('method', 'base/path', json=None)  # type: ignore[attr-defined]
+    api_direct._session.request.assert_called_once_with('method', URL('base/path'), json=None)  # type: ignore[union-attr]
     assert result == dict(foo='bar')
 
 
 async def test_body(api_direct: TwitchApiDirect):
     result = await api_direct._request('method', 'path', data=dict(a=1, b=['hello', 'world']))
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'method', 'base/path', json=dict(a=1, b=['hello', 'world'])
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'method', URL('base/path'), json=dict(a=1, b=['hello', 'world'])
     )
     assert result == dict(foo='bar')
 
@@ -40,20 +72,271 @@ async def test_raise(api_direct: TwitchApiDirect, mocker: MockerFixture):
     with pytest.raises(Exception, match='Bad status') as exc_info:
         await api_direct._request('method', 'path')
     assert exc_info.value is exc
-    api_direct._session.request.assert_called_once_with('method', 'base/path', json=None)  # type: ignore[attr-defined]
+    api_direct._session.request.assert_called_once_with('method', URL('base/path'), json=None)  # type: ignore[union-attr]
 
 
 async def test_no_raise(api_direct: TwitchApiDirect, mocker: MockerFixture):
     mocker.patch('tests.MockResponse.raise_for_status', side_effect=Exception('Bad status'))
     result = await api_direct._request('method', 'path', raise_for_status=False)
-    api_direct._session.request.assert_called_once_with('method', 'base/path', json=None)  # type: ignore[attr-defined]
-    assert result == dict(foo='bar')
+    api_direct._session.request.assert_called_once_with('method', URL('base/path'), json=None)  # type: ignore[union-attr]
+    assert result == dict(foo='bar')
+
+
+async def test_request_outside_context():
+    api = TwitchApiDirect(client_id='test client', token='test token', logger=logger)
+    assert api._session is None
+    with pytest.raises(RuntimeError, match='must be entered with `async with`'):
+        await api._request('method', 'path')
+
+
+async def test_enter_twice():
+    async with TwitchApiDirect(client_id='test client', token='test token', logger=logger) as api:
+        session = api._session
+        with pytest.raises(RuntimeError, match='already entered'):
+            await api.__aenter__()
+        assert api._session is session
+
+
+async def test_connector_closed_if_session_fails(mocker: MockerFixture):
+    mocker.patch('aiohttp.ClientSession', side_effect=ValueError('bad session'))
+    close = mocker.spy(aiohttp.TCPConnector, 'close')
+    api = TwitchApiDirect(client_id='test client', token='test token', logger=logger)
+    with pytest.raises(ValueError, match='bad session'):
+        await api.__aenter__()
+    close.assert_called_once()
+    assert api._session is None
+
+
+async def test_session_closed_on_exit():
+    api = TwitchApiDirect(client_id='test client', token='oauth:session_token', logger=logger)
+    async with api:
+        session = api._session
+        assert session is not None
+        assert session.headers['Client-ID'] == 'test client'
+        assert session.headers['Authorization'] == 'Bearer session_token'
+        assert session.headers['Accept-Encoding'].startswith('gzip, deflate')
+    assert session.closed
+    assert api._session is None
+
+
+async def test_session_accepts_brotli(mocker: MockerFixture):
+    mocker.patch('green_eggs.api.direct._accept_encoding', 'gzip, deflate, br')
+    async with TwitchApiDirect(client_id='test client', token='test token', logger=logger) as api:
+        assert api._session is not None
+        assert api._session.headers['Accept-Encoding'] == 'gzip, deflate, br'
+
+
+async def test_set_token_keeps_session():
+    async with TwitchApiDirect(client_id='test client', token='first_token', logger=logger) as api:
+        session = api._session
+        assert session is not None
+        api.set_token('oauth:second_token')
+        assert api._session is session
+        assert session.headers['Authorization'] == 'Bearer second_token'
+        assert session.headers['Client-ID'] == 'test client'
+
+
+@pytest.mark.parametrize('token', ['abc123', 'oauth:abc123'])
+async def test_set_token_strips_prefix_only(token: str):
+    api = TwitchApiDirect(client_id='test client', token='test token', logger=logger)
+    api.set_token(token)
+    assert api._headers['Authorization'] == 'Bearer abc123'
+
+
+async def test_session_connector_limits():
+    async with TwitchApiDirect(client_id='test client', token='test token', logger=logger, pool_limit=5) as api:
+        connector = api._session.connector  # type: ignore[union-attr]
+        assert isinstance(connector, aiohttp.TCPConnector)
+        assert connector.limit == 5
+        assert connector.limit_per_host == 5
+        assert isinstance(connector._resolver, aiohttp.AsyncResolver)
+
+
+async def test_get_cache(mocker: MockerFixture):
+    mocker.patch('aiohttp.ClientSession.request', side_effect=lambda *args, **kwargs: response_context())
+    async with TwitchApiDirect(
+        client_id='test client', token='test token', logger=logger, get_cache_ttls=dict(users=60)
+    ) as api:
+        api._base_url = URL('base/')
+        first = await api._request('GET', 'users', params=dict(id='1'))
+        assert await api._request('GET', 'users', params=dict(id='1')) is first
+        await api._request('GET', 'users', params=dict(id='2'))
+        await api._request('GET', 'streams', params=dict(id='1'))
+        await api._request('GET', 'streams', params=dict(id='1'))
+        await api._request('POST', 'users', params=dict(id='1'))
+        await api._request('GET', 'users', params=dict(id='3'), raise_for_status=False)
+        await api._request('GET', 'users', params=dict(id='3'), raise_for_status=False)
+        assert [call.args[1] for call in api._session.request.call_args_list] == [  # type: ignore[union-attr]
+            URL('base/users?id=1'),
+            URL('base/users?id=2'),
+            URL('base/streams?id=1'),
+            URL('base/streams?id=1'),
+            URL('base/users?id=1'),
+            URL('base/users?id=3'),
+            URL('base/users?id=3'),
+        ]
+
+
+async def test_get_cache_expired(mocker: MockerFixture):
+    mocker.patch('aiohttp.ClientSession.request', side_effect=lambda *args, **kwargs: response_context())
+    async with TwitchApiDirect(
+        client_id='test client', token='test token', logger=logger, get_cache_ttls=dict(users=60)
+    ) as api:
+        monotonic = mocker.patch('time.monotonic', return_value=100.0)
+        await api._request('GET', 'users')
+        monotonic.return_value = 159.0
+        await api._request('GET', 'users')
+        assert api._session.request.call_count == 1  # type: ignore[union-attr]
+        monotonic.return_value = 160.0
+        await api._request('GET', 'users')
+        assert api._session.request.call_count == 2  # type: ignore[union-attr]
+
+
+async def test_get_cache_max_size(mocker: MockerFixture):
+    mocker.patch('aiohttp.ClientSession.request', side_effect=lambda *args, **kwargs: response_context())
+    mocker.patch.object(TwitchApiDirect, '_get_cache_max_size', 2)
+    async with TwitchApiDirect(
+        client_id='test client', token='test token', logger=logger, get_cache_ttls=dict(users=60)
+    ) as api:
+        api._base_url = URL('base/')
+        await api._request('GET', 'users', params=dict(id='1'))
+        await api._request('GET', 'users', params=dict(id='2'))
+        await api._request('GET', 'users', params=dict(id='1'))
+        await api._request('GET', 'users', params=dict(id='3'))
+        assert list(api._get_cache) == [URL('base/users?id=1'), URL('base/users?id=3')]
+        assert api._session.request.call_count == 3  # type: ignore[union-attr]
+
+
+async def test_in_flight_gets_coalesced(mocker: MockerFixture):
+    mocker.patch('aiohttp.ClientSession.request', side_effect=lambda *args, **kwargs: response_context())
+    async with TwitchApiDirect(client_id='test client', token='test token', logger=logger) as api:
+        api._base_url = URL('base/')
+        first, second, other = await asyncio.gather(
+            api._request('GET', 'users', params=dict(id='1')),
+            api._request('GET', 'users', params=dict(id='1')),
+            api._request('GET', 'users', params=dict(id='2')),
+        )
+        assert first is second
+        assert other is not first
+        await asyncio.gather(api._request('POST', 'users'), api._request('POST', 'users'))
+        assert [call.args[1] for call in api._session.request.call_args_list] == [  # type: ignore[union-attr]
+            URL('base/users?id=1'),
+            URL('base/users?id=2'),
+            URL('base/users'),
+            URL('base/users'),
+        ]
+        assert api._in_flight_gets == dict()
+
+
+async def test_in_flight_get_cancelled_without_waiters(mocker: MockerFixture):
+    @contextlib.asynccontextmanager
+    async def hanging_response(*args, **kwargs):
+        await asyncio.Event().wait()
+        yield
+
+    mocker.patch('aiohttp.ClientSession.request', side_effect=hanging_response)
+    async with TwitchApiDirect(client_id='test client', token='test token', logger=logger) as api:
+        api._base_url = URL('base/')
+        request = asyncio.ensure_future(api._request('GET', 'users'))
+        await asyncio.sleep(0)
+        in_flight = api._in_flight_gets[URL('base/users')]
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(request, timeout=0.01)
+        assert api._in_flight_gets == dict()
+        with pytest.raises(asyncio.CancelledError):
+            await in_flight.task
+
+
+async def test_in_flight_get_kept_for_other_waiters(mocker: MockerFixture):
+    release = asyncio.Event()
+
+    @contextlib.asynccontextmanager
+    async def delayed_response(*args, **kwargs):
+        await release.wait()
+        yield MockResponse()
+
+    mocker.patch('aiohttp.ClientSession.request', side_effect=delayed_response)
+    async with TwitchApiDirect(client_id='test client', token='test token', logger=logger) as api:
+        first = asyncio.ensure_future(api._request('GET', 'users'))
+        second = asyncio.ensure_future(api._request('GET', 'users'))
+        await asyncio.sleep(0)
+        first.cancel()
+        await asyncio.sleep(0)
+        release.set()
+        assert await second == dict(foo='bar')
+        assert first.cancelled()
+        assert api._session.request.call_count == 1  # type: ignore[union-attr]
+
+
+@pytest.fixture
+def fake_clock(mocker: MockerFixture):
+    # Sleeping moves the clock forward instead of waiting, and still lets other tasks run meanwhile
+    clock = SimpleNamespace(now=100.0, delays=[])
+    real_sleep = asyncio.sleep
+
+    async def sleep(delay):
+        clock.delays.append(delay)
+        wake_at = clock.now + delay
+        await real_sleep(0)
+        clock.now = max(clock.now, wake_at)
+
+    mocker.patch('time.time', side_effect=lambda: clock.now)
+    mocker.patch('asyncio.sleep', sleep)
+    return clock
+
+
+async def test_rate_limit_waits_for_reset(mocker: MockerFixture, fake_clock):
+    headers = {'Ratelimit-Remaining': '0', 'Ratelimit-Reset': '130'}
+    mocker.patch('aiohttp.ClientSession.request', side_effect=lambda *args, **kwargs: response_context(headers=headers))
+    async with TwitchApiDirect(client_id='test client', token='test token', logger=logger) as api:
+        await api._request('POST', 'users')
+        assert fake_clock.delays == []
+        headers = {'Ratelimit-Remaining': '5', 'Ratelimit-Reset': '190'}
+        await api._request('POST', 'users')
+        assert fake_clock.delays == [30.0]
+        await api._request('POST', 'users')
+        assert fake_clock.delays == [30.0]
+        assert api._ratelimit_remaining == 5
+        assert api._ratelimit_reset == 190.0
+
+
+async def test_rate_limit_refills_across_reset(mocker: MockerFixture, fake_clock):
+    headers = {'Ratelimit-Limit': '2', 'Ratelimit-Remaining': '0', 'Ratelimit-Reset': '130'}
+    sent_at = []
+
+    def request(*args, **kwargs):
+        sent_at.append(fake_clock.now)
+        return response_context(headers=headers)
+
+    mocker.patch('aiohttp.ClientSession.request', side_effect=request)
+    async with TwitchApiDirect(client_id='test client', token='test token', logger=logger) as api:
+        await api._request('POST', 'users')
+        # No numbers from helix until after the burst, so only the client's own count holds it back
+        headers = dict()
+        await asyncio.gather(*(api._request('POST', 'users') for _ in range(5)))
+        assert sent_at == [100.0, 130.0, 130.0, 190.0, 190.0, 250.0]
+
+
+async def test_gather(api_direct: TwitchApiDirect):
+    running = 0
+    most_running = 0
+
+    async def call(result):
+        nonlocal running, most_running
+        running += 1
+        most_running = max(most_running, running)
+        await asyncio.sleep(0)
+        running -= 1
+        return result
+
+    assert await api_direct.gather(*(call(i) for i in range(10)), concurrency=3) == list(range(10))
+    assert most_running == 3
 
 
 async def test_start_commercial(api_direct: TwitchApiDirect):
     result = await api_direct.start_commercial(broadcaster_id='1', length=2)
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'POST', 'base/channels/commercial', json={'broadcaster_id': '1', 'length': 2}
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'POST', URL('base/channels/commercial'), json={'broadcaster_id': '1', 'length': 2}
     )
     assert result == dict(foo='bar')
 
@@ -62,16 +345,16 @@ async def test_get_extension_analytics(api_direct: TwitchApiDirect):
     result = await api_direct.get_extension_analytics(
         after='1', ended_at='2', extension_id='3', first=4, started_at='5', type_='6'
     )
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/analytics/extensions?after=1&ended_at=2&extension_id=3&first=4&started_at=5&type=6', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/analytics/extensions?after=1&ended_at=2&extension_id=3&first=4&started_at=5&type=6'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_get_extension_analytics_exclude_empty(api_direct: TwitchApiDirect):
     result = await api_direct.get_extension_analytics()
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/analytics/extensions', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/analytics/extensions'), json=None
     )
     assert result == dict(foo='bar')
 
@@ -80,72 +363,72 @@ async def test_get_game_analytics(api_direct: TwitchApiDirect):
     result = await api_direct.get_game_analytics(
         after='1', ended_at='2', first=3, game_id='4', started_at='5', type_='6'
     )
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/analytics/games?after=1&ended_at=2&first=3&game_id=4&started_at=5&type=6', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/analytics/games?after=1&ended_at=2&first=3&game_id=4&started_at=5&type=6'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_get_game_analytics_exclude_empty(api_direct: TwitchApiDirect):
     result = await api_direct.get_game_analytics()
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/analytics/games', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/analytics/games'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_get_bits_leaderboard(api_direct: TwitchApiDirect):
     result = await api_direct.get_bits_leaderboard(count=1, period='2', started_at='3', user_id='4')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/bits/leaderboard?count=1&period=2&started_at=3&user_id=4', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/bits/leaderboard?count=1&period=2&started_at=3&user_id=4'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_get_bits_leaderboard_exclude_empty(api_direct: TwitchApiDirect):
     result = await api_direct.get_bits_leaderboard()
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/bits/leaderboard', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/bits/leaderboard'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_get_cheermotes(api_direct: TwitchApiDirect):
     result = await api_direct.get_cheermotes(broadcaster_id='1')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/bits/cheermotes?broadcaster_id=1', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/bits/cheermotes?broadcaster_id=1'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_get_cheermotes_exclude_empty(api_direct: TwitchApiDirect):
     result = await api_direct.get_cheermotes()
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/bits/cheermotes', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/bits/cheermotes'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_get_extension_transactions(api_direct: TwitchApiDirect):
     result = await api_direct.get_extension_transactions(extension_id='1', id_=['2', 'also'], after='3', first=4)
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/extensions/transactions?after=3&extension_id=1&first=4&id=2&id=also', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/extensions/transactions?after=3&extension_id=1&first=4&id=2&id=also'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_get_extension_transactions_exclude_empty(api_direct: TwitchApiDirect):
     result = await api_direct.get_extension_transactions(extension_id='1')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/extensions/transactions?extension_id=1', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/extensions/transactions?extension_id=1'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_get_channel_information(api_direct: TwitchApiDirect):
     result = await api_direct.get_channel_information(broadcaster_id='1')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/channels?broadcaster_id=1', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/channels?broadcaster_id=1'), json=None
     )
     assert result == dict(foo='bar')
 
@@ -154,9 +437,9 @@ async def test_modify_channel_information(api_direct: TwitchApiDirect):
     result = await api_direct.modify_channel_information(
         broadcaster_id='1', game_id='2', broadcaster_language='3', title='4', delay=5
     )
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
         'PATCH',
-        'base/channels?broadcaster_id=1',
+        URL('base/channels?broadcaster_id=1'),
         json={'broadcaster_language': '3', 'delay': 5, 'game_id': '2', 'title': '4'},
     )
     assert result == dict(foo='bar')
@@ -164,16 +447,16 @@ async def test_modify_channel_information(api_direct: TwitchApiDirect):
 
 async def test_modify_channel_information_exclude_empty(api_direct: TwitchApiDirect):
     result = await api_direct.modify_channel_information(broadcaster_id='1')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'PATCH', 'base/channels?broadcaster_id=1', json=dict()
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'PATCH', URL('base/channels?broadcaster_id=1'), json=dict()
     )
     assert result == dict(foo='bar')
 
 
 async def test_get_channel_editors(api_direct: TwitchApiDirect):
     result = await api_direct.get_channel_editors(broadcaster_id='1')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/channels/editors?broadcaster_id=1', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/channels/editors?broadcaster_id=1'), json=None
     )
     assert result == dict(foo='bar')
 
@@ -195,9 +478,9 @@ async def test_create_custom_rewards(api_direct: TwitchApiDirect):
         global_cooldown_seconds=13,
         should_redemptions_skip_request_queue=False,
     )
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
         'POST',
-        'base/channel_points/custom_rewards?broadcaster_id=1',
+        URL('base/channel_points/custom_rewards?broadcaster_id=1'),
         json={
             'title': '2',
             'cost': 3,
@@ -219,25 +502,25 @@ async def test_create_custom_rewards(api_direct: TwitchApiDirect):
 
 async def test_create_custom_rewards_exclude_empty(api_direct: TwitchApiDirect):
     result = await api_direct.create_custom_rewards(broadcaster_id='1', title='2', cost=3)
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'POST', 'base/channel_points/custom_rewards?broadcaster_id=1', json={'cost': 3, 'title': '2'}
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'POST', URL('base/channel_points/custom_rewards?broadcaster_id=1'), json={'cost': 3, 'title': '2'}
     )
     assert result == dict(foo='bar')
 
 
 async def test_delete_custom_reward(api_direct: TwitchApiDirect):
     result = await api_direct.delete_custom_reward(broadcaster_id='1', id_='2')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'DELETE', 'base/channel_points/custom_rewards?broadcaster_id=1&id=2', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'DELETE', URL('base/channel_points/custom_rewards?broadcaster_id=1&id=2'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_get_custom_reward(api_direct: TwitchApiDirect):
     result = await api_direct.get_custom_reward(broadcaster_id='1', id_=['2', 'also'], only_manageable_rewards=True)
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
         'GET',
-        'base/channel_points/custom_rewards?broadcaster_id=1&id=2&id=also&only_manageable_rewards=true',
+        URL('base/channel_points/custom_rewards?broadcaster_id=1&id=2&id=also&only_manageable_rewards=true'),
         json=None,
     )
     assert result == dict(foo='bar')
@@ -245,8 +528,8 @@ async def test_get_custom_reward(api_direct: TwitchApiDirect):
 
 async def test_get_custom_reward_exclude_empty(api_direct: TwitchApiDirect):
     result = await api_direct.get_custom_reward(broadcaster_id='1')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/channel_points/custom_rewards?broadcaster_id=1', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/channel_points/custom_rewards?broadcaster_id=1'), json=None
     )
     assert result == dict(foo='bar')
 
@@ -255,10 +538,12 @@ async def test_get_custom_reward_redemption(api_direct: TwitchApiDirect):
     result = await api_direct.get_custom_reward_redemption(
         broadcaster_id='1', reward_id='2', id_=['3', 'also'], status='4', sort='5', after='6', first=7
     )
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
         'GET',
-        'base/channel_points/custom_rewards/redemptions'
-        '?after=6&broadcaster_id=1&first=7&id=3&id=also&reward_id=2&sort=5&status=4',
+        URL(
+            'base/channel_points/custom_rewards/redemptions'
+            '?after=6&broadcaster_id=1&first=7&id=3&id=also&reward_id=2&sort=5&status=4'
+        ),
         json=None,
     )
     assert result == dict(foo='bar')
@@ -266,8 +551,8 @@ async def test_get_custom_reward_redemption(api_direct: TwitchApiDirect):
 
 async def test_get_custom_reward_redemption_exclude_empty(api_direct: TwitchApiDirect):
     result = await api_direct.get_custom_reward_redemption(broadcaster_id='1', reward_id='2')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/channel_points/custom_rewards/redemptions?broadcaster_id=1&reward_id=2', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/channel_points/custom_rewards/redemptions?broadcaster_id=1&reward_id=2'), json=None
     )
     assert result == dict(foo='bar')
 
@@ -291,9 +576,9 @@ async def test_update_custom_reward(api_direct: TwitchApiDirect):
         is_paused=False,
         should_redemptions_skip_request_queue=True,
     )
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
         'PATCH',
-        'base/channel_points/custom_rewards?broadcaster_id=1&id=2',
+        URL('base/channel_points/custom_rewards?broadcaster_id=1&id=2'),
         json={
             'title': '3',
             'prompt': '4',
@@ -316,17 +601,17 @@ async def test_update_custom_reward(api_direct: TwitchApiDirect):
 
 async def test_update_custom_reward_exclude_empty(api_direct: TwitchApiDirect):
     result = await api_direct.update_custom_reward(broadcaster_id='1', id_='2')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'PATCH', 'base/channel_points/custom_rewards?broadcaster_id=1&id=2', json=dict()
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'PATCH', URL('base/channel_points/custom_rewards?broadcaster_id=1&id=2'), json=dict()
     )
     assert result == dict(foo='bar')
 
 
 async def test_update_redemption_status(api_direct: TwitchApiDirect):
     result = await api_direct.update_redemption_status(id_=['1', 'also'], broadcaster_id='2', reward_id='3', status='4')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
         'PATCH',
-        'base/channel_points/custom_rewards/redemptions?broadcaster_id=2&id=1&id=also&reward_id=3',
+        URL('base/channel_points/custom_rewards/redemptions?broadcaster_id=2&id=1&id=also&reward_id=3'),
         json={'status': '4'},
     )
     assert result == dict(foo='bar')
@@ -334,56 +619,56 @@ async def test_update_redemption_status(api_direct: TwitchApiDirect):
 
 async def test_get_channel_emotes(api_direct: TwitchApiDirect):
     result = await api_direct.get_channel_emotes(broadcaster_id='1')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/chat/emotes?broadcaster_id=1', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/chat/emotes?broadcaster_id=1'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_get_global_emotes(api_direct: TwitchApiDirect):
     result = await api_direct.get_global_emotes()
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/chat/emotes/global', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/chat/emotes/global'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_get_emote_sets(api_direct: TwitchApiDirect):
     result = await api_direct.get_emote_sets(emote_set_id='1')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/chat/emotes/set?emote_set_id=1', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/chat/emotes/set?emote_set_id=1'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_get_channel_chat_badges(api_direct: TwitchApiDirect):
     result = await api_direct.get_channel_chat_badges(broadcaster_id='1')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/chat/badges?broadcaster_id=1', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/chat/badges?broadcaster_id=1'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_get_global_chat_badges(api_direct: TwitchApiDirect):
     result = await api_direct.get_global_chat_badges()
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/chat/badges/global', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/chat/badges/global'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_get_chat_settings(api_direct: TwitchApiDirect):
     result = await api_direct.get_chat_settings(broadcaster_id='1', moderator_id='2')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/chat/settings?broadcaster_id=1&moderator_id=2', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/chat/settings?broadcaster_id=1&moderator_id=2'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_get_chat_settings_exclude_empty(api_direct: TwitchApiDirect):
     result = await api_direct.get_chat_settings(broadcaster_id='1')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/chat/settings?broadcaster_id=1', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/chat/settings?broadcaster_id=1'), json=None
     )
     assert result == dict(foo='bar')
 
@@ -402,9 +687,9 @@ async def test_update_chat_settings(api_direct: TwitchApiDirect):
         subscriber_mode=True,
         unique_chat_mode=False,
     )
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
         'PATCH',
-        'base/chat/settings?broadcaster_id=1&moderator_id=2',
+        URL('base/chat/settings?broadcaster_id=1&moderator_id=2'),
         json=dict(
             emote_mode=True,
             follower_mode=False,
@@ -422,24 +707,24 @@ async def test_update_chat_settings(api_direct: TwitchApiDirect):
 
 async def test_update_chat_settings_exclude_empty(api_direct: TwitchApiDirect):
     result = await api_direct.update_chat_settings(broadcaster_id='1', moderator_id='2')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'PATCH', 'base/chat/settings?broadcaster_id=1&moderator_id=2', json=dict()
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'PATCH', URL('base/chat/settings?broadcaster_id=1&moderator_id=2'), json=dict()
     )
     assert result == dict(foo='bar')
 
 
 async def test_create_clip(api_direct: TwitchApiDirect):
     result = await api_direct.create_clip(broadcaster_id='1', has_delay=True)
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'POST', 'base/clips?broadcaster_id=1&has_delay=true', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'POST', URL('base/clips?broadcaster_id=1&has_delay=true'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_create_clip_exclude_empty(api_direct: TwitchApiDirect):
     result = await api_direct.create_clip(broadcaster_id='1')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'POST', 'base/clips?broadcaster_id=1', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'POST', URL('base/clips?broadcaster_id=1'), json=None
     )
     assert result == dict(foo='bar')
 
@@ -448,9 +733,9 @@ async def test_get_clips(api_direct: TwitchApiDirect):
     result = await api_direct.get_clips(
         broadcaster_id='1', game_id='2', id_=['3', 'also'], after='4', before='5', ended_at='6', first=7, started_at='8'
     )
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
         'GET',
-        'base/clips?after=4&before=5&broadcaster_id=1&ended_at=6&first=7&game_id=2&id=3&id=also&started_at=8',
+        URL('base/clips?after=4&before=5&broadcaster_id=1&ended_at=6&first=7&game_id=2&id=3&id=also&started_at=8'),
         json=None,
     )
     assert result == dict(foo='bar')
@@ -458,16 +743,16 @@ async def test_get_clips(api_direct: TwitchApiDirect):
 
 async def test_get_clips_exclude_empty(api_direct: TwitchApiDirect):
     result = await api_direct.get_clips(broadcaster_id='1', game_id='2', id_=['3', 'also'])
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/clips?broadcaster_id=1&game_id=2&id=3&id=also', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/clips?broadcaster_id=1&game_id=2&id=3&id=also'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_get_code_status(api_direct: TwitchApiDirect):
     result = await api_direct.get_code_status()
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/entitlements/codes', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/entitlements/codes'), json=None
     )
     assert result == dict(foo='bar')
 
@@ -476,56 +761,56 @@ async def test_get_drops_entitlements(api_direct: TwitchApiDirect):
     result = await api_direct.get_drops_entitlements(
         id_='1', user_id='2', game_id='3', fulfillment_status='4', after='5', first=6
     )
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/entitlements/drops?after=5&first=6&fulfillment_status=4&game_id=3&id=1&user_id=2', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/entitlements/drops?after=5&first=6&fulfillment_status=4&game_id=3&id=1&user_id=2'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_get_drops_entitlements_exclude_empty(api_direct: TwitchApiDirect):
     result = await api_direct.get_drops_entitlements()
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/entitlements/drops', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/entitlements/drops'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_update_drops_entitlements(api_direct: TwitchApiDirect):
     result = await api_direct.update_drops_entitlements(entitlement_ids=['1', 'also'], fulfillment_status='2')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'PATCH', 'base/entitlements/drops?entitlement_ids=1&entitlement_ids=also&fulfillment_status=2', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'PATCH', URL('base/entitlements/drops?entitlement_ids=1&entitlement_ids=also&fulfillment_status=2'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_update_drops_entitlements_exclude_empty(api_direct: TwitchApiDirect):
     result = await api_direct.update_drops_entitlements()
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'PATCH', 'base/entitlements/drops', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'PATCH', URL('base/entitlements/drops'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_redeem_code(api_direct: TwitchApiDirect):
     result = await api_direct.redeem_code(code='1', user_id=2)
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'POST', 'base/entitlements/codes?code=1&user_id=2', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'POST', URL('base/entitlements/codes?code=1&user_id=2'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_redeem_code_exclude_empty(api_direct: TwitchApiDirect):
     result = await api_direct.redeem_code()
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'POST', 'base/entitlements/codes', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'POST', URL('base/entitlements/codes'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_get_extension_configuration_segment(api_direct: TwitchApiDirect):
     result = await api_direct.get_extension_configuration_segment(broadcaster_id='1', extension_id='2', segment='3')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/extensions/configurations?broadcaster_id=1&extension_id=2&segment=3', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/extensions/configurations?broadcaster_id=1&extension_id=2&segment=3'), json=None
     )
     assert result == dict(foo='bar')
 
@@ -534,9 +819,9 @@ async def test_set_extension_configuration_segment(api_direct: TwitchApiDirect):
     result = await api_direct.set_extension_configuration_segment(
         extension_id='1', segment='2', broadcaster_id='3', content='4', version='5'
     )
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
         'PUT',
-        'base/extensions/configurations',
+        URL('base/extensions/configurations'),
         json={'extension_id': '1', 'segment': '2', 'broadcaster_id': '3', 'content': '4', 'version': '5'},
     )
     assert result == dict(foo='bar')
@@ -544,8 +829,8 @@ async def test_set_extension_configuration_segment(api_direct: TwitchApiDirect):
 
 async def test_set_extension_configuration_segment_exclude_empty(api_direct: TwitchApiDirect):
     result = await api_direct.set_extension_configuration_segment(extension_id='1', segment='2')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'PUT', 'base/extensions/configurations', json={'extension_id': '1', 'segment': '2'}
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'PUT', URL('base/extensions/configurations'), json={'extension_id': '1', 'segment': '2'}
     )
     assert result == dict(foo='bar')
 
@@ -554,9 +839,9 @@ async def test_set_extension_required_configuration(api_direct: TwitchApiDirect)
     result = await api_direct.set_extension_required_configuration(
         broadcaster_id='1', extension_id='2', extension_version='3', configuration_version='4'
     )
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
         'PUT',
-        'base/extensions/required_configuration?broadcaster_id=1',
+        URL('base/extensions/required_configuration?broadcaster_id=1'),
         json={'configuration_version': '4', 'extension_id': '2', 'extension_version': '3'},
     )
     assert result == dict(foo='bar')
@@ -566,9 +851,9 @@ async def test_send_extension_pubsub_message(api_direct: TwitchApiDirect):
     result = await api_direct.send_extension_pubsub_message(
         target=['1', 'also'], broadcaster_id='2', is_global_broadcast=True, message='4'
     )
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
         'POST',
-        'base/extensions/pubsub',
+        URL('base/extensions/pubsub'),
         json={'broadcaster_id': '2', 'is_global_broadcast': True, 'message': '4', 'target': ['1', 'also']},
     )
     assert result == dict(foo='bar')
@@ -576,40 +861,40 @@ async def test_send_extension_pubsub_message(api_direct: TwitchApiDirect):
 
 async def test_get_extension_live_channels(api_direct: TwitchApiDirect):
     result = await api_direct.get_extension_live_channels(extension_id='1', first=2, after='3')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/extensions/live?after=3&extension_id=1&first=2', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/extensions/live?after=3&extension_id=1&first=2'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_get_extension_live_channels_exclude_empty(api_direct: TwitchApiDirect):
     result = await api_direct.get_extension_live_channels(extension_id='1')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/extensions/live?extension_id=1', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/extensions/live?extension_id=1'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_get_extension_secrets(api_direct: TwitchApiDirect):
     result = await api_direct.get_extension_secrets()
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/extensions/jwt/secrets', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/extensions/jwt/secrets'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_create_extension_secret(api_direct: TwitchApiDirect):
     result = await api_direct.create_extension_secret(delay=1)
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'POST', 'base/extensions/jwt/secrets?delay=1', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'POST', URL('base/extensions/jwt/secrets?delay=1'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_create_extension_secret_exclude_empty(api_direct: TwitchApiDirect):
     result = await api_direct.create_extension_secret()
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'POST', 'base/extensions/jwt/secrets', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'POST', URL('base/extensions/jwt/secrets'), json=None
     )
     assert result == dict(foo='bar')
 
@@ -618,9 +903,9 @@ async def test_send_extension_chat_message(api_direct: TwitchApiDirect):
     result = await api_direct.send_extension_chat_message(
         broadcaster_id='1', text='2', extension_id='3', extension_version='4'
     )
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
         'POST',
-        'base/extensions/chat?broadcaster_id=1',
+        URL('base/extensions/chat?broadcaster_id=1'),
         json={'extension_id': '3', 'extension_version': '4', 'text': '2'},
     )
     assert result == dict(foo='bar')
@@ -628,48 +913,48 @@ async def test_send_extension_chat_message(api_direct: TwitchApiDirect):
 
 async def test_get_extensions(api_direct: TwitchApiDirect):
     result = await api_direct.get_extensions(extension_id='1', extension_version='2')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/extensions?extension_id=1&extension_version=2', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/extensions?extension_id=1&extension_version=2'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_get_extensions_exclude_empty(api_direct: TwitchApiDirect):
     result = await api_direct.get_extensions(extension_id='1')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/extensions?extension_id=1', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/extensions?extension_id=1'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_get_released_extensions(api_direct: TwitchApiDirect):
     result = await api_direct.get_released_extensions(extension_id='1', extension_version='2')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/extensions/released?extension_id=1&extension_version=2', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/extensions/released?extension_id=1&extension_version=2'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_get_released_extensions_exclude_empty(api_direct: TwitchApiDirect):
     result = await api_direct.get_released_extensions(extension_id='1')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/extensions/released?extension_id=1', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/extensions/released?extension_id=1'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_get_extension_bits_products(api_direct: TwitchApiDirect):
     result = await api_direct.get_extension_bits_products(should_include_all=True)
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/bits/extensions?should_include_all=true', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/bits/extensions?should_include_all=true'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_get_extension_bits_products_exclude_empty(api_direct: TwitchApiDirect):
     result = await api_direct.get_extension_bits_products()
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/bits/extensions', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/bits/extensions'), json=None
     )
     assert result == dict(foo='bar')
 
@@ -678,9 +963,9 @@ async def test_update_extension_bits_product(api_direct: TwitchApiDirect):
     result = await api_direct.update_extension_bits_product(
         cost_amount=1, cost_type='2', display_name='3', expiration='4', in_development=True, is_broadcast=False, sku='5'
     )
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
         'PUT',
-        'base/bits/extensions',
+        URL('base/bits/extensions'),
         json={
             'cost': {'amount': 1, 'type': '2'},
             'display_name': '3',
@@ -695,8 +980,8 @@ async def test_update_extension_bits_product(api_direct: TwitchApiDirect):
 
 async def test_update_extension_bits_product_exclude_empty(api_direct: TwitchApiDirect):
     result = await api_direct.update_extension_bits_product(cost_amount=1, cost_type='2', display_name='3', sku='4')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'PUT', 'base/bits/extensions', json={'cost': {'amount': 1, 'type': '2'}, 'display_name': '3', 'sku': '4'}
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'PUT', URL('base/bits/extensions'), json={'cost': {'amount': 1, 'type': '2'}, 'display_name': '3', 'sku': '4'}
     )
     assert result == dict(foo='bar')
 
@@ -705,9 +990,9 @@ async def test_create_eventsub_subscription(api_direct: TwitchApiDirect):
     result = await api_direct.create_eventsub_subscription(
         type_='1', version='2', condition=dict(key=3), transport=dict(key=4)
     )
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
         'POST',
-        'base/eventsub/subscriptions',
+        URL('base/eventsub/subscriptions'),
         json={'condition': {'key': 3}, 'transport': {'key': 4}, 'type': '1', 'version': '2'},
     )
     assert result == dict(foo='bar')
@@ -715,81 +1000,79 @@ async def test_create_eventsub_subscription(api_direct: TwitchApiDirect):
 
 async def test_delete_eventsub_subscription(api_direct: TwitchApiDirect):
     result = await api_direct.delete_eventsub_subscription(id_='1')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'DELETE', 'base/eventsub/subscriptions?id=1', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'DELETE', URL('base/eventsub/subscriptions?id=1'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_get_eventsub_subscriptions(api_direct: TwitchApiDirect):
     result = await api_direct.get_eventsub_subscriptions(status='1', type_='2', after='3')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/eventsub/subscriptions?after=3&status=1&type=2', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/eventsub/subscriptions?after=3&status=1&type=2'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_get_eventsub_subscriptions_exclude_empty(api_direct: TwitchApiDirect):
     result = await api_direct.get_eventsub_subscriptions()
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/eventsub/subscriptions', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/eventsub/subscriptions'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_get_top_games(api_direct: TwitchApiDirect):
     result = await api_direct.get_top_games(after='1', before='2', first=3)
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/games/top?after=1&before=2&first=3', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/games/top?after=1&before=2&first=3'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_get_top_games_exclude_empty(api_direct: TwitchApiDirect):
     result = await api_direct.get_top_games()
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/games/top', json=None
-    )
+    api_direct._session.request.assert_called_once_with('GET', URL('base/games/top'), json=None)  # type: ignore[union-attr]
     assert result == dict(foo='bar')
 
 
 async def test_get_games(api_direct: TwitchApiDirect):
     result = await api_direct.get_games(id_='1', name='2')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/games?id=1&name=2', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/games?id=1&name=2'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_get_creator_goals(api_direct: TwitchApiDirect):
     result = await api_direct.get_creator_goals(broadcaster_id='1')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/goals?broadcaster_id=1', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/goals?broadcaster_id=1'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_get_hype_train_events(api_direct: TwitchApiDirect):
     result = await api_direct.get_hype_train_events(broadcaster_id='1', first=2, id_='3', cursor='4')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/hypetrain/events?broadcaster_id=1&cursor=4&first=2&id=3', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/hypetrain/events?broadcaster_id=1&cursor=4&first=2&id=3'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_get_hype_train_events_exclude_empty(api_direct: TwitchApiDirect):
     result = await api_direct.get_hype_train_events(broadcaster_id='1')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/hypetrain/events?broadcaster_id=1', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/hypetrain/events?broadcaster_id=1'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_check_automod_status(api_direct: TwitchApiDirect):
     result = await api_direct.check_automod_status(broadcaster_id='1', msg_id='2', msg_text='3', user_id='4')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
         'POST',
-        'base/moderation/enforcements/status?broadcaster_id=1',
+        URL('base/moderation/enforcements/status?broadcaster_id=1'),
         json={'msg_id': '2', 'msg_text': '3', 'user_id': '4'},
     )
     assert result == dict(foo='bar')
@@ -797,16 +1080,16 @@ async def test_check_automod_status(api_direct: TwitchApiDirect):
 
 async def test_manage_held_automod_messages(api_direct: TwitchApiDirect):
     result = await api_direct.manage_held_automod_messages(user_id='1', msg_id='2', action='3')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'POST', 'base/moderation/automod/message', json={'action': '3', 'msg_id': '2', 'user_id': '1'}
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'POST', URL('base/moderation/automod/message'), json={'action': '3', 'msg_id': '2', 'user_id': '1'}
     )
     assert result == dict(foo='bar')
 
 
 async def test_get_automod_settings(api_direct: TwitchApiDirect):
     result = await api_direct.get_automod_settings(broadcaster_id='1', moderator_id='2')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/moderation/automod/settings?broadcaster_id=1&moderator_id=2', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/moderation/automod/settings?broadcaster_id=1&moderator_id=2'), json=None
     )
     assert result == dict(foo='bar')
 
@@ -825,9 +1108,9 @@ async def test_update_automod_settings(api_direct: TwitchApiDirect):
         sexuality_sex_or_gender=10,
         swearing=11,
     )
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
         'PUT',
-        'base/moderation/automod/settings?broadcaster_id=1&moderator_id=2',
+        URL('base/moderation/automod/settings?broadcaster_id=1&moderator_id=2'),
         json=dict(
             aggression=3,
             bullying=4,
@@ -845,24 +1128,24 @@ async def test_update_automod_settings(api_direct: TwitchApiDirect):
 
 async def test_update_automod_settings_exclude_empty(api_direct: TwitchApiDirect):
     result = await api_direct.update_automod_settings(broadcaster_id='1', moderator_id='2')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'PUT', 'base/moderation/automod/settings?broadcaster_id=1&moderator_id=2', json=dict()
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'PUT', URL('base/moderation/automod/settings?broadcaster_id=1&moderator_id=2'), json=dict()
     )
     assert result == dict(foo='bar')
 
 
 async def test_get_banned_events(api_direct: TwitchApiDirect):
     result = await api_direct.get_banned_events(broadcaster_id='1', user_id=['2', 'also'], after='3', first='4')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/moderation/banned/events?after=3&broadcaster_id=1&first=4&user_id=2&user_id=also', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/moderation/banned/events?after=3&broadcaster_id=1&first=4&user_id=2&user_id=also'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_get_banned_events_exclude_empty(api_direct: TwitchApiDirect):
     result = await api_direct.get_banned_events(broadcaster_id='1')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/moderation/banned/events?broadcaster_id=1', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/moderation/banned/events?broadcaster_id=1'), json=None
     )
     assert result == dict(foo='bar')
 
@@ -871,25 +1154,25 @@ async def test_get_banned_users(api_direct: TwitchApiDirect):
     result = await api_direct.get_banned_users(
         broadcaster_id='1', user_id=['2', 'also'], first='3', after='4', before='5'
     )
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/moderation/banned?after=4&before=5&broadcaster_id=1&first=3&user_id=2&user_id=also', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/moderation/banned?after=4&before=5&broadcaster_id=1&first=3&user_id=2&user_id=also'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_get_banned_users_exclude_empty(api_direct: TwitchApiDirect):
     result = await api_direct.get_banned_users(broadcaster_id='1')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/moderation/banned?broadcaster_id=1', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/moderation/banned?broadcaster_id=1'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_ban_user(api_direct: TwitchApiDirect):
     result = await api_direct.ban_user(broadcaster_id='1', moderator_id='2', duration=4, reason='5', user_id='6')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
         'POST',
-        'base/moderation/bans?broadcaster_id=1&moderator_id=2',
+        URL('base/moderation/bans?broadcaster_id=1&moderator_id=2'),
         json=dict(data=dict(duration=4, reason='5', user_id='6')),
     )
     assert result == dict(foo='bar')
@@ -897,9 +1180,9 @@ async def test_ban_user(api_direct: TwitchApiDirect):
 
 async def test_ban_user_exclude_empty(api_direct: TwitchApiDirect):
     result = await api_direct.ban_user(broadcaster_id='1', moderator_id='2', reason='4', user_id='5')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
         'POST',
-        'base/moderation/bans?broadcaster_id=1&moderator_id=2',
+        URL('base/moderation/bans?broadcaster_id=1&moderator_id=2'),
         json=dict(data=dict(reason='4', user_id='5')),
     )
     assert result == dict(foo='bar')
@@ -907,88 +1190,90 @@ async def test_ban_user_exclude_empty(api_direct: TwitchApiDirect):
 
 async def test_unban_user(api_direct: TwitchApiDirect):
     result = await api_direct.unban_user(broadcaster_id='1', moderator_id='2', user_id='3')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'DELETE', 'base/moderation/bans?broadcaster_id=1&moderator_id=2&user_id=3', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'DELETE', URL('base/moderation/bans?broadcaster_id=1&moderator_id=2&user_id=3'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_get_blocked_terms(api_direct: TwitchApiDirect):
     result = await api_direct.get_blocked_terms(broadcaster_id='1', moderator_id='2', after='3', first=4)
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/moderation/blocked_terms?after=3&broadcaster_id=1&first=4&moderator_id=2', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/moderation/blocked_terms?after=3&broadcaster_id=1&first=4&moderator_id=2'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_get_blocked_terms_exclude_empty(api_direct: TwitchApiDirect):
     result = await api_direct.get_blocked_terms(broadcaster_id='1', moderator_id='2')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/moderation/blocked_terms?broadcaster_id=1&moderator_id=2', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/moderation/blocked_terms?broadcaster_id=1&moderator_id=2'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_add_blocked_term(api_direct: TwitchApiDirect):
     result = await api_direct.add_blocked_term(broadcaster_id='1', moderator_id='2', text='3')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'POST', 'base/moderation/blocked_terms?broadcaster_id=1&moderator_id=2', json=dict(text='3')
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'POST', URL('base/moderation/blocked_terms?broadcaster_id=1&moderator_id=2'), json=dict(text='3')
     )
     assert result == dict(foo='bar')
 
 
 async def test_remove_blocked_term(api_direct: TwitchApiDirect):
     result = await api_direct.remove_blocked_term(broadcaster_id='1', id_='2', moderator_id='3')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'DELETE', 'base/moderation/blocked_terms?broadcaster_id=1&id=2&moderator_id=3', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'DELETE', URL('base/moderation/blocked_terms?broadcaster_id=1&id=2&moderator_id=3'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_get_moderators(api_direct: TwitchApiDirect):
     result = await api_direct.get_moderators(broadcaster_id='1', user_id=['2', 'also'], first='3', after='4')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/moderation/moderators?after=4&broadcaster_id=1&first=3&user_id=2&user_id=also', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/moderation/moderators?after=4&broadcaster_id=1&first=3&user_id=2&user_id=also'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_get_moderators_exclude_empty(api_direct: TwitchApiDirect):
     result = await api_direct.get_moderators(broadcaster_id='1')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/moderation/moderators?broadcaster_id=1', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/moderation/moderators?broadcaster_id=1'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_get_moderator_events(api_direct: TwitchApiDirect):
     result = await api_direct.get_moderator_events(broadcaster_id='1', user_id=['2', 'also'], after='3', first='4')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/moderation/moderators/events?after=3&broadcaster_id=1&first=4&user_id=2&user_id=also', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET',
+        URL('base/moderation/moderators/events?after=3&broadcaster_id=1&first=4&user_id=2&user_id=also'),
+        json=None,
     )
     assert result == dict(foo='bar')
 
 
 async def test_get_moderator_events_exclude_empty(api_direct: TwitchApiDirect):
     result = await api_direct.get_moderator_events(broadcaster_id='1')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/moderation/moderators/events?broadcaster_id=1', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/moderation/moderators/events?broadcaster_id=1'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_get_polls(api_direct: TwitchApiDirect):
     result = await api_direct.get_polls(broadcaster_id='1', id_=['2', 'also'], after='3', first='4')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/polls?after=3&broadcaster_id=1&first=4&id=2&id=also', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/polls?after=3&broadcaster_id=1&first=4&id=2&id=also'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_get_polls_exclude_empty(api_direct: TwitchApiDirect):
     result = await api_direct.get_polls(broadcaster_id='1')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/polls?broadcaster_id=1', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/polls?broadcaster_id=1'), json=None
     )
     assert result == dict(foo='bar')
 
@@ -1004,9 +1289,9 @@ async def test_create_poll(api_direct: TwitchApiDirect):
         channel_points_voting_enabled=False,
         channel_points_per_vote=8,
     )
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
         'POST',
-        'base/polls',
+        URL('base/polls'),
         json={
             'broadcaster_id': '1',
             'title': '2',
@@ -1023,9 +1308,9 @@ async def test_create_poll(api_direct: TwitchApiDirect):
 
 async def test_create_poll_exclude_empty(api_direct: TwitchApiDirect):
     result = await api_direct.create_poll(broadcaster_id='1', title='2', choice_title=['3', 'also'], duration=4)
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
         'POST',
-        'base/polls',
+        URL('base/polls'),
         json={'broadcaster_id': '1', 'choices': [{'title': '3'}, {'title': 'also'}], 'duration': 4, 'title': '2'},
     )
     assert result == dict(foo='bar')
@@ -1033,24 +1318,24 @@ async def test_create_poll_exclude_empty(api_direct: TwitchApiDirect):
 
 async def test_end_poll(api_direct: TwitchApiDirect):
     result = await api_direct.end_poll(broadcaster_id='1', id_='2', status='3')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'PATCH', 'base/polls', json={'broadcaster_id': '1', 'id': '2', 'status': '3'}
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'PATCH', URL('base/polls'), json={'broadcaster_id': '1', 'id': '2', 'status': '3'}
     )
     assert result == dict(foo='bar')
 
 
 async def test_get_predictions(api_direct: TwitchApiDirect):
     result = await api_direct.get_predictions(broadcaster_id='1', id_=['2', 'also'], after='3', first='4')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/predictions?after=3&broadcaster_id=1&first=4&id=2&id=also', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/predictions?after=3&broadcaster_id=1&first=4&id=2&id=also'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_get_predictions_exclude_empty(api_direct: TwitchApiDirect):
     result = await api_direct.get_predictions(broadcaster_id='1')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/predictions?broadcaster_id=1', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/predictions?broadcaster_id=1'), json=None
     )
     assert result == dict(foo='bar')
 
@@ -1059,9 +1344,9 @@ async def test_create_prediction(api_direct: TwitchApiDirect):
     result = await api_direct.create_prediction(
         broadcaster_id='1', title='2', outcome_title=['3', 'also'], prediction_window=4
     )
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
         'POST',
-        'base/predictions',
+        URL('base/predictions'),
         json={
             'broadcaster_id': '1',
             'outcomes': [{'title': '3'}, {'title': 'also'}],
@@ -1074,16 +1359,18 @@ async def test_create_prediction(api_direct: TwitchApiDirect):
 
 async def test_end_prediction(api_direct: TwitchApiDirect):
     result = await api_direct.end_prediction(broadcaster_id='1', id_='2', status='3', winning_outcome_id='4')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'PATCH', 'base/predictions', json={'broadcaster_id': '1', 'id': '2', 'status': '3', 'winning_outcome_id': '4'}
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'PATCH',
+        URL('base/predictions'),
+        json={'broadcaster_id': '1', 'id': '2', 'status': '3', 'winning_outcome_id': '4'},
     )
     assert result == dict(foo='bar')
 
 
 async def test_end_prediction_exclude_empty(api_direct: TwitchApiDirect):
     result = await api_direct.end_prediction(broadcaster_id='1', id_='2', status='3')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'PATCH', 'base/predictions', json={'broadcaster_id': '1', 'id': '2', 'status': '3'}
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'PATCH', URL('base/predictions'), json={'broadcaster_id': '1', 'id': '2', 'status': '3'}
     )
     assert result == dict(foo='bar')
 
@@ -1092,24 +1379,24 @@ async def test_get_channel_stream_schedule(api_direct: TwitchApiDirect):
     result = await api_direct.get_channel_stream_schedule(
         broadcaster_id='1', id_=['2', 'also'], start_time='3', utc_offset='4', first=5, after='6'
     )
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/schedule?after=6&broadcaster_id=1&first=5&id=2&id=also&start_time=3&utc_offset=4', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/schedule?after=6&broadcaster_id=1&first=5&id=2&id=also&start_time=3&utc_offset=4'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_get_channel_stream_schedule_exclude_empty(api_direct: TwitchApiDirect):
     result = await api_direct.get_channel_stream_schedule(broadcaster_id='1')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/schedule?broadcaster_id=1', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/schedule?broadcaster_id=1'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_get_channel_icalendar(api_direct: TwitchApiDirect):
     result = await api_direct.get_channel_icalendar(broadcaster_id='1')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/schedule/icalendar?broadcaster_id=1', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/schedule/icalendar?broadcaster_id=1'), json=None
     )
     assert result == dict(foo='bar')
 
@@ -1118,10 +1405,12 @@ async def test_update_channel_stream_schedule(api_direct: TwitchApiDirect):
     result = await api_direct.update_channel_stream_schedule(
         broadcaster_id='1', is_vacation_enabled=True, vacation_start_time='3', vacation_end_time='4', timezone='5'
     )
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
         'PATCH',
-        'base/schedule/settings'
-        '?broadcaster_id=1&is_vacation_enabled=true&timezone=5&vacation_end_time=4&vacation_start_time=3',
+        URL(
+            'base/schedule/settings'
+            '?broadcaster_id=1&is_vacation_enabled=true&timezone=5&vacation_end_time=4&vacation_start_time=3'
+        ),
         json=None,
     )
     assert result == dict(foo='bar')
@@ -1129,8 +1418,8 @@ async def test_update_channel_stream_schedule(api_direct: TwitchApiDirect):
 
 async def test_update_channel_stream_schedule_exclude_empty(api_direct: TwitchApiDirect):
     result = await api_direct.update_channel_stream_schedule(broadcaster_id='1')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'PATCH', 'base/schedule/settings?broadcaster_id=1', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'PATCH', URL('base/schedule/settings?broadcaster_id=1'), json=None
     )
     assert result == dict(foo='bar')
 
@@ -1139,9 +1428,9 @@ async def test_create_channel_stream_schedule_segment(api_direct: TwitchApiDirec
     result = await api_direct.create_channel_stream_schedule_segment(
         broadcaster_id='1', start_time='2', timezone='3', is_recurring=True, duration='5', category_id='6', title='7'
     )
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
         'POST',
-        'base/schedule/segment?broadcaster_id=1',
+        URL('base/schedule/segment?broadcaster_id=1'),
         json={
             'start_time': '2',
             'timezone': '3',
@@ -1158,9 +1447,9 @@ async def test_create_channel_stream_schedule_segment_exclude_empty(api_direct:
     result = await api_direct.create_channel_stream_schedule_segment(
         broadcaster_id='1', start_time='2', timezone='3', is_recurring=True
     )
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
         'POST',
-        'base/schedule/segment?broadcaster_id=1',
+        URL('base/schedule/segment?broadcaster_id=1'),
         json={'is_recurring': True, 'start_time': '2', 'timezone': '3'},
     )
     assert result == dict(foo='bar')
@@ -1177,9 +1466,9 @@ async def test_update_channel_stream_schedule_segment(api_direct: TwitchApiDirec
         is_canceled=True,
         timezone='8',
     )
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
         'PATCH',
-        'base/schedule/segment?broadcaster_id=1&id=2',
+        URL('base/schedule/segment?broadcaster_id=1&id=2'),
         json={
             'start_time': '3',
             'duration': '4',
@@ -1194,80 +1483,80 @@ async def test_update_channel_stream_schedule_segment(api_direct: TwitchApiDirec
 
 async def test_update_channel_stream_schedule_segment_exclude_empty(api_direct: TwitchApiDirect):
     result = await api_direct.update_channel_stream_schedule_segment(broadcaster_id='1', id_='2')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'PATCH', 'base/schedule/segment?broadcaster_id=1&id=2', json=dict()
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'PATCH', URL('base/schedule/segment?broadcaster_id=1&id=2'), json=dict()
     )
     assert result == dict(foo='bar')
 
 
 async def test_delete_channel_stream_schedule_segment(api_direct: TwitchApiDirect):
     result = await api_direct.delete_channel_stream_schedule_segment(broadcaster_id='1', id_='2')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'DELETE', 'base/schedule/segment?broadcaster_id=1&id=2', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'DELETE', URL('base/schedule/segment?broadcaster_id=1&id=2'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_search_categories(api_direct: TwitchApiDirect):
     result = await api_direct.search_categories(query='1', first=2, after='3')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/search/categories?after=3&first=2&query=1', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/search/categories?after=3&first=2&query=1'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_search_categories_exclude_empty(api_direct: TwitchApiDirect):
     result = await api_direct.search_categories(query='1')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/search/categories?query=1', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/search/categories?query=1'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_search_channels(api_direct: TwitchApiDirect):
     result = await api_direct.search_channels(query='1', first=2, after='3', live_only=True)
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/search/channels?after=3&first=2&live_only=true&query=1', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/search/channels?after=3&first=2&live_only=true&query=1'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_search_channels_exclude_empty(api_direct: TwitchApiDirect):
     result = await api_direct.search_channels(query='1')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/search/channels?query=1', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/search/channels?query=1'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_get_soundtrack_current_track(api_direct: TwitchApiDirect):
     result = await api_direct.get_soundtrack_current_track(broadcaster_id='1')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/soundtrack/current_track?broadcaster_id=1', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/soundtrack/current_track?broadcaster_id=1'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_get_soundtrack_playlist(api_direct: TwitchApiDirect):
     result = await api_direct.get_soundtrack_playlist(id_='1')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/soundtrack/playlist?id=1', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/soundtrack/playlist?id=1'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_get_soundtrack_playlists(api_direct: TwitchApiDirect):
     result = await api_direct.get_soundtrack_playlists()
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/soundtrack/playlists', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/soundtrack/playlists'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_get_stream_key(api_direct: TwitchApiDirect):
     result = await api_direct.get_stream_key(broadcaster_id='1')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/streams/key?broadcaster_id=1', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/streams/key?broadcaster_id=1'), json=None
     )
     assert result == dict(foo='bar')
 
@@ -1276,264 +1565,264 @@ async def test_get_streams(api_direct: TwitchApiDirect):
     result = await api_direct.get_streams(
         after='1', before='2', first=3, game_id='4', language='5', user_id='6', user_login='7'
     )
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/streams?after=1&before=2&first=3&game_id=4&language=5&user_id=6&user_login=7', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/streams?after=1&before=2&first=3&game_id=4&language=5&user_id=6&user_login=7'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_get_streams_exclude_empty(api_direct: TwitchApiDirect):
     result = await api_direct.get_streams()
-    api_direct._session.request.assert_called_once_with('GET', 'base/streams', json=None)  # type: ignore[attr-defined]
+    api_direct._session.request.assert_called_once_with('GET', URL('base/streams'), json=None)  # type: ignore[union-attr]
     assert result == dict(foo='bar')
 
 
 async def test_get_followed_streams(api_direct: TwitchApiDirect):
     result = await api_direct.get_followed_streams(user_id='1', after='2', first=3)
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/streams/followed?after=2&first=3&user_id=1', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/streams/followed?after=2&first=3&user_id=1'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_get_followed_streams_exclude_empty(api_direct: TwitchApiDirect):
     result = await api_direct.get_followed_streams(user_id='1')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/streams/followed?user_id=1', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/streams/followed?user_id=1'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_create_stream_marker(api_direct: TwitchApiDirect):
     result = await api_direct.create_stream_marker(user_id='1', description='2')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'POST', 'base/streams/markers', json={'description': '2', 'user_id': '1'}
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'POST', URL('base/streams/markers'), json={'description': '2', 'user_id': '1'}
     )
     assert result == dict(foo='bar')
 
 
 async def test_create_stream_marker_exclude_empty(api_direct: TwitchApiDirect):
     result = await api_direct.create_stream_marker(user_id='1')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'POST', 'base/streams/markers', json={'user_id': '1'}
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'POST', URL('base/streams/markers'), json={'user_id': '1'}
     )
     assert result == dict(foo='bar')
 
 
 async def test_get_stream_markers(api_direct: TwitchApiDirect):
     result = await api_direct.get_stream_markers(user_id='1', video_id='2', after='3', before='4', first='5')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/streams/markers?after=3&before=4&first=5&user_id=1&video_id=2', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/streams/markers?after=3&before=4&first=5&user_id=1&video_id=2'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_get_stream_markers_exclude_empty(api_direct: TwitchApiDirect):
     result = await api_direct.get_stream_markers(user_id='1', video_id='2')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/streams/markers?user_id=1&video_id=2', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/streams/markers?user_id=1&video_id=2'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_get_broadcaster_subscriptions(api_direct: TwitchApiDirect):
     result = await api_direct.get_broadcaster_subscriptions(broadcaster_id='1', user_id='2', after='3', first='4')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/subscriptions?after=3&broadcaster_id=1&first=4&user_id=2', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/subscriptions?after=3&broadcaster_id=1&first=4&user_id=2'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_get_broadcaster_subscriptions_exclude_empty(api_direct: TwitchApiDirect):
     result = await api_direct.get_broadcaster_subscriptions(broadcaster_id='1')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/subscriptions?broadcaster_id=1', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/subscriptions?broadcaster_id=1'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_check_user_subscription(api_direct: TwitchApiDirect):
     result = await api_direct.check_user_subscription(broadcaster_id='1', user_id='2')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/subscriptions/user?broadcaster_id=1&user_id=2', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/subscriptions/user?broadcaster_id=1&user_id=2'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_get_all_stream_tags(api_direct: TwitchApiDirect):
     result = await api_direct.get_all_stream_tags(after='1', first=2, tag_id='3')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/tags/streams?after=1&first=2&tag_id=3', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/tags/streams?after=1&first=2&tag_id=3'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_get_all_stream_tags_exclude_empty(api_direct: TwitchApiDirect):
     result = await api_direct.get_all_stream_tags()
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/tags/streams', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/tags/streams'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_get_stream_tags(api_direct: TwitchApiDirect):
     result = await api_direct.get_stream_tags(broadcaster_id='1')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/streams/tags?broadcaster_id=1', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/streams/tags?broadcaster_id=1'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_replace_stream_tags(api_direct: TwitchApiDirect):
     result = await api_direct.replace_stream_tags(broadcaster_id='1', tag_ids=['2', 'also'])
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'PUT', 'base/streams/tags?broadcaster_id=1', json={'tag_ids': ['2', 'also']}
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'PUT', URL('base/streams/tags?broadcaster_id=1'), json={'tag_ids': ['2', 'also']}
     )
     assert result == dict(foo='bar')
 
 
 async def test_replace_stream_tags_exclude_empty(api_direct: TwitchApiDirect):
     result = await api_direct.replace_stream_tags(broadcaster_id='1')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'PUT', 'base/streams/tags?broadcaster_id=1', json=dict()
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'PUT', URL('base/streams/tags?broadcaster_id=1'), json=dict()
     )
     assert result == dict(foo='bar')
 
 
 async def test_get_channel_teams(api_direct: TwitchApiDirect):
     result = await api_direct.get_channel_teams(broadcaster_id='1')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/teams/channel?broadcaster_id=1', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/teams/channel?broadcaster_id=1'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_get_teams(api_direct: TwitchApiDirect):
     result = await api_direct.get_teams(name='1', id_='2')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/teams?id=2&name=1', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/teams?id=2&name=1'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_get_teams_exclude_empty(api_direct: TwitchApiDirect):
     result = await api_direct.get_teams()
-    api_direct._session.request.assert_called_once_with('GET', 'base/teams', json=None)  # type: ignore[attr-defined]
+    api_direct._session.request.assert_called_once_with('GET', URL('base/teams'), json=None)  # type: ignore[union-attr]
     assert result == dict(foo='bar')
 
 
 async def test_get_users(api_direct: TwitchApiDirect):
     result = await api_direct.get_users(id_=['1', 'also'], login=['2', 'also'])
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/users?id=1&id=also&login=2&login=also', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/users?id=1&id=also&login=2&login=also'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_get_users_exclude_empty(api_direct: TwitchApiDirect):
     result = await api_direct.get_users()
-    api_direct._session.request.assert_called_once_with('GET', 'base/users', json=None)  # type: ignore[attr-defined]
+    api_direct._session.request.assert_called_once_with('GET', URL('base/users'), json=None)  # type: ignore[union-attr]
     assert result == dict(foo='bar')
 
 
 async def test_update_user(api_direct: TwitchApiDirect):
     result = await api_direct.update_user(description='1')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'PUT', 'base/users?description=1', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'PUT', URL('base/users?description=1'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_update_user_exclude_empty(api_direct: TwitchApiDirect):
     result = await api_direct.update_user()
-    api_direct._session.request.assert_called_once_with('PUT', 'base/users', json=None)  # type: ignore[attr-defined]
+    api_direct._session.request.assert_called_once_with('PUT', URL('base/users'), json=None)  # type: ignore[union-attr]
     assert result == dict(foo='bar')
 
 
 async def test_get_users_follows(api_direct: TwitchApiDirect):
     result = await api_direct.get_users_follows(after='1', first=2, from_id='3', to_id='4')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/users/follows?after=1&first=2&from_id=3&to_id=4', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/users/follows?after=1&first=2&from_id=3&to_id=4'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_get_users_follows_exclude_empty(api_direct: TwitchApiDirect):
     result = await api_direct.get_users_follows()
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/users/follows', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/users/follows'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_get_user_block_list(api_direct: TwitchApiDirect):
     result = await api_direct.get_user_block_list(broadcaster_id='1', first=2, after='3')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/users/blocks?after=3&broadcaster_id=1&first=2', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/users/blocks?after=3&broadcaster_id=1&first=2'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_get_user_block_list_exclude_empty(api_direct: TwitchApiDirect):
     result = await api_direct.get_user_block_list(broadcaster_id='1')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/users/blocks?broadcaster_id=1', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/users/blocks?broadcaster_id=1'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_block_user(api_direct: TwitchApiDirect):
     result = await api_direct.block_user(target_user_id='1', source_context='2', reason='3')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'PUT', 'base/users/blocks?reason=3&source_context=2&target_user_id=1', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'PUT', URL('base/users/blocks?reason=3&source_context=2&target_user_id=1'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_block_user_exclude_empty(api_direct: TwitchApiDirect):
     result = await api_direct.block_user(target_user_id='1')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'PUT', 'base/users/blocks?target_user_id=1', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'PUT', URL('base/users/blocks?target_user_id=1'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_unblock_user(api_direct: TwitchApiDirect):
     result = await api_direct.unblock_user(target_user_id='1')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'DELETE', 'base/users/blocks?target_user_id=1', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'DELETE', URL('base/users/blocks?target_user_id=1'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_get_user_extensions(api_direct: TwitchApiDirect):
     result = await api_direct.get_user_extensions()
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/users/extensions/list', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/users/extensions/list'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_get_user_active_extensions(api_direct: TwitchApiDirect):
     result = await api_direct.get_user_active_extensions(user_id='1')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/users/extensions?user_id=1', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/users/extensions?user_id=1'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_get_user_active_extensions_exclude_empty(api_direct: TwitchApiDirect):
     result = await api_direct.get_user_active_extensions()
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/users/extensions', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/users/extensions'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_update_user_extensions(api_direct: TwitchApiDirect):
     result = await api_direct.update_user_extensions()
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'PUT', 'base/users/extensions', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'PUT', URL('base/users/extensions'), json=None
     )
     assert result == dict(foo='bar')
 
@@ -1551,9 +1840,9 @@ async def test_get_videos(api_direct: TwitchApiDirect):
         sort='9',
         type_='10',
     )
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
         'GET',
-        'base/videos?after=4&before=5&first=6&game_id=3&id=1&id=also&language=7&period=8&sort=9&type=10&user_id=2',
+        URL('base/videos?after=4&before=5&first=6&game_id=3&id=1&id=also&language=7&period=8&sort=9&type=10&user_id=2'),
         json=None,
     )
     assert result == dict(foo='bar')
@@ -1561,15 +1850,15 @@ async def test_get_videos(api_direct: TwitchApiDirect):
 
 async def test_get_videos_exclude_empty(api_direct: TwitchApiDirect):
     result = await api_direct.get_videos(id_=['1', 'also'], user_id='2', game_id='3')
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/videos?game_id=3&id=1&id=also&user_id=2', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/videos?game_id=3&id=1&id=also&user_id=2'), json=None
     )
     assert result == dict(foo='bar')
 
 
 async def test_delete_videos(api_direct: TwitchApiDirect):
     result = await api_direct.delete_videos(id_=['1', 'also'])
-    api_direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'DELETE', 'base/videos?id=1&id=also', json=None
+    api_direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'DELETE', URL('base/videos?id=1&id=also'), json=None
     )
     assert result == dict(foo='bar')
@@ -3,6 +3,7 @@ import asyncio
 
 import pytest
 from pytest_mock import MockerFixture
+from yarl import URL
 
 from green_eggs.api import TwitchApiCommon
 from green_eggs.channel import Channel
@@ -46,7 +47,7 @@ async def test_check_for_links_does_nothing_by_default(api_common: TwitchApiComm
         priv_msg(handle_able_kwargs=dict(message='Go to youtube.com'), tags_kwargs=dict(id='message-with-link'))
     )
     assert channel._chat._websocket._send_buffer.empty()  # type: ignore[union-attr]
-    api_common.direct._session.request.assert_not_called()  # type: ignore[attr-defined]
+    api_common.direct._session.request.assert_not_called()  # type: ignore[union-attr]
 
 
 async def test_check_for_links_deletes_message(api_common: TwitchApiCommon, channel: Channel, mocker: MockerFixture):
@@ -135,7 +136,7 @@ async def test_check_for_links_allows_permitted(api_common: TwitchApiCommon, cha
         )
     )
     assert channel._chat._websocket._send_buffer.empty()  # type: ignore[union-attr]
-    api_common.direct._session.request.assert_not_called()  # type: ignore[attr-defined]
+    api_common.direct._session.request.assert_not_called()  # type: ignore[union-attr]
     channel._logger.debug.assert_called_once_with(  # type: ignore[attr-defined]
         'Link(s) allowed because permit: [\'youtube.com\']'
     )
@@ -168,7 +169,7 @@ async def test_check_for_links_allows_permitted_after_message_without_link(
     )
     assert 'sender' not in channel._permit_cache
     assert channel._chat._websocket._send_buffer.empty()  # type: ignore[union-attr]
-    api_common.direct._session.request.assert_not_called()  # type: ignore[attr-defined]
+    api_common.direct._session.request.assert_not_called()  # type: ignore[union-attr]
     channel._logger.debug.assert_called_once_with(  # type: ignore[attr-defined]
         'Link(s) allowed because permit: [\'youtube.com\']'
     )
@@ -338,7 +339,7 @@ async def test_check_for_links_allows_moderator_always(
         )
     )
     assert channel._chat._websocket._send_buffer.empty()  # type: ignore[union-attr]
-    api_common.direct._session.request.assert_not_called()  # type: ignore[attr-defined]
+    api_common.direct._session.request.assert_not_called()  # type: ignore[union-attr]
     channel._logger.debug.assert_called_once_with(  # type: ignore[attr-defined]
         'Link(s) allowed because moderator: [\'youtube.com\']'
     )
@@ -380,7 +381,7 @@ async def test_check_for_links_allows_valid_link_format(
         )
     )
     assert channel._chat._websocket._send_buffer.empty()  # type: ignore[union-attr]
-    api_common.direct._session.request.assert_not_called()  # type: ignore[attr-defined]
+    api_common.direct._session.request.assert_not_called()  # type: ignore[union-attr]
     channel._logger.debug.assert_called_once_with(  # type: ignore[attr-defined]
         'Link(s) allowed by target format: [\'https://clips.twitch.tv/ABCD-srao89esir2ua\']'
     )
@@ -515,7 +516,7 @@ async def test_is_user_moderator_true_with_broadcaster_id(api_common: TwitchApiC
     )
     result = await channel.is_user_moderator('123')
     assert result
-    api_common.direct._session.request.assert_not_called()  # type: ignore[attr-defined]
+    api_common.direct._session.request.assert_not_called()  # type: ignore[union-attr]
 
 
 async def test_is_user_moderator_true_if_they_sent_moderator_messages(api_common: TwitchApiCommon, channel: Channel):
@@ -527,7 +528,7 @@ async def test_is_user_moderator_true_if_they_sent_moderator_messages(api_common
     )
     result = await channel.is_user_moderator('mod-id')
     assert result
-    api_common.direct._session.request.assert_not_called()  # type: ignore[attr-defined]
+    api_common.direct._session.request.assert_not_called()  # type: ignore[union-attr]
 
 
 async def test_is_user_moderator_true_if_api_says_so(
@@ -552,7 +553,7 @@ async def test_is_user_moderator_false_if_they_sent_non_moderator_messages(
     )
     result = await channel.is_user_moderator('not-mod-id')
     assert not result
-    api_common.direct._session.request.assert_not_called()  # type: ignore[attr-defined]
+    api_common.direct._session.request.assert_not_called()  # type: ignore[union-attr]
 
 
 async def test_is_user_moderator_false_if_the_api_says_so(
@@ -581,37 +582,37 @@ async def test_is_user_subscribed_with_messages(channel: Channel):
     channel.handle_message(message_not_subscribed)
     assert await channel.is_user_subscribed('123')
     assert '123' not in channel._api_results_cache
-    channel._api.direct._session.request.assert_not_called()  # type: ignore[attr-defined]
+    channel._api.direct._session.request.assert_not_called()  # type: ignore[union-attr]
 
 
 async def test_is_user_subscribed_with_api(channel: Channel):
-    channel._api.direct._session.request.return_value = response_context(  # type: ignore[attr-defined]
+    channel._api.direct._session.request.return_value = response_context(  # type: ignore[union-attr]
         return_json=dict(data=[dict(tier='1000')])
     )
     assert '123' not in channel._api_results_cache
     assert await channel.is_user_subscribed('123')
     assert '123' in channel._api_results_cache
-    channel._api.direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/subscriptions/user?broadcaster_id=&user_id=123', json=None
+    channel._api.direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/subscriptions/user?broadcaster_id=&user_id=123'), json=None
     )
 
 
 async def test_is_user_subscribed_false_with_api(channel: Channel):
-    channel._api.direct._session.request.return_value = response_context(  # type: ignore[attr-defined]
+    channel._api.direct._session.request.return_value = response_context(  # type: ignore[union-attr]
         return_json=dict(data=[dict()])
     )
     assert '123' not in channel._api_results_cache
     assert not await channel.is_user_subscribed('123')
     assert '123' in channel._api_results_cache
-    channel._api.direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/subscriptions/user?broadcaster_id=&user_id=123', json=None
+    channel._api.direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/subscriptions/user?broadcaster_id=&user_id=123'), json=None
     )
 
 
 async def test_is_user_subscribed_with_cache(channel: Channel):
     channel._api_results_cache['123'] = dict(is_subscribed=True)
     assert await channel.is_user_subscribed('123')
-    channel._api.direct._session.request.assert_not_called()  # type: ignore[attr-defined]
+    channel._api.direct._session.request.assert_not_called()  # type: ignore[union-attr]
 
 
 def test_is_user_vip_true_if_they_sent_vip_messages(channel: Channel):
@@ -682,3 +683,20 @@ async def test_send(channel: Channel):
 async def test_send_too_long(channel: Channel):
     with pytest.raises(ValueError, match='Messages cannot exceed 500 characters'):
         await channel.send('A' * 501)
+
+
+async def test_send_many(channel: Channel):
+    await channel.send_many(['first message', '/me second message '])
+    sent = channel._chat._websocket._send_buffer.get_nowait()  # type: ignore[union-attr]
+    assert sent == 'PRIVMSG #channel_user :first message\r\nPRIVMSG #channel_user :/me second message'
+
+
+async def test_send_many_empty(channel: Channel):
+    await channel.send_many([])
+    assert channel._chat._websocket._send_buffer.empty()  # type: ignore[union-attr]
+
+
+async def test_send_many_too_long(channel: Channel):
+    with pytest.raises(ValueError, match='Messages cannot exceed 500 characters'):
+        await channel.send_many(['fine', 'A' * 501])
+    assert channel._chat._websocket._send_buffer.empty()  # type: ignore[union-attr]
@@ -5,6 +5,7 @@ import time
 from typing import Any, Dict, List
 
 import pytest
+from yarl import URL
 
 from green_eggs.api import TwitchApiCommon
 from green_eggs.channel import Channel
@@ -81,14 +82,14 @@ async def test_mod_trigger_broadcaster(channel: Channel):
 
 
 async def test_mod_trigger_normal(api_common: TwitchApiCommon, channel: Channel):
-    api_common.direct._session.request.return_value = response_context(  # type: ignore[attr-defined]
+    api_common.direct._session.request.return_value = response_context(  # type: ignore[union-attr]
         return_json=dict(data=[])
     )
     trigger = SenderIsModTrigger()
     message = priv_msg()
     assert not await trigger.check(message, channel)
-    api_common.direct._session.request.assert_called_once_with(  # type: ignore[attr-defined]
-        'GET', 'base/moderation/moderators?broadcaster_id=&first=100', json=None
+    api_common.direct._session.request.assert_called_once_with(  # type: ignore[union-attr]
+        'GET', URL('base/moderation/moderators?broadcaster_id=&first=100'), json=None
     )
 
 
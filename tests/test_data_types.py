@@ -2,7 +2,6 @@
 import datetime
 import json
 from pathlib import Path
-from typing import Optional
 
 from green_eggs import data_types as dt
 from tests.utils.data_types import join_part, priv_msg
@@ -19,14 +18,10 @@ def default_json_dump(obj):
 
 
 def data_type_from_data(raw: str) -> dt.HandleAble:
-    result: Optional[dt.HandleAble] = None
-    for handle_type, pattern in dt.patterns.items():
-        found = pattern.match(raw)
-        if found is not None:
-            result = handle_type.from_match_dict(**found.groupdict(), raw=raw, default_timestamp=None)
-            break
-    assert result is not None
-    return result
+    matched = dt.match_handle_type(raw)
+    assert matched is not None
+    handle_type, match_dict = matched
+    return handle_type.from_match_dict(**match_dict, raw=raw, default_timestamp=None)
 
 
 def base_asserts(data, handle_type):
@@ -123,6 +118,18 @@ def test_joinpart_is_join():
     assert not joinpart.is_join
 
 
+def test_match_handle_type_no_match():
+    assert dt.match_handle_type(':tmi.twitch.tv PING') is None
+
+
+def test_match_handle_type_returns_match_groups():
+    raw = ':some_user!some_user@some_user.tmi.twitch.tv JOIN #channel_user'
+    assert dt.match_handle_type(raw) == (
+        dt.JoinPart,
+        dict(who='some_user', action='JOIN', where='channel_user'),
+    )
+
+
 def test_privmsg_action_ban():
     privmsg = priv_msg(handle_able_kwargs=dict(who='bad_user'))
     assert privmsg.action_ban() == '/ban bad_user'